@@ -2,7 +2,6 @@
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
 from datetime import UTC, datetime
@@ -19,6 +18,7 @@ from anibridge_mappings.core.aggregator import (
 )
 from anibridge_mappings.core.provenance import build_provenance_payload
 from anibridge_mappings.core.stats import build_stats
+from anibridge_mappings.utils.serialization import dumps
 
 log = logging.getLogger(__name__)
 
@@ -118,11 +118,7 @@ def write_payload(path: Path, payload: dict[str, Any], *, pretty: bool = True) -
         pretty (bool): Whether to pretty-print JSON with indentation.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    if pretty:
-        rendered = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
-    else:
-        rendered = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-    path.write_text(rendered, encoding="utf-8")
+    path.write_bytes(dumps(payload, pretty=pretty))
 
 
 def write_zstd(path: Path, payload: dict[str, Any]) -> None:
@@ -133,9 +129,7 @@ def write_zstd(path: Path, payload: dict[str, Any]) -> None:
         payload (dict[str, Any]): Serialized mapping payload.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    data = dumps(payload)
     compressor = ZstdCompressor()
     path.write_bytes(compressor.compress(data))
 
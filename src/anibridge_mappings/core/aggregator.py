@@ -30,6 +30,7 @@ from anibridge_mappings.sources.anime_offline_database import (
 )
 from anibridge_mappings.sources.base import (
     BaseSource,
+    CachedMetadataSource,
     EpisodeMappingSource,
     IdMappingSource,
     MetadataSource,
@@ -108,7 +109,7 @@ class MappingAggregator:
 
         log.info(f"Collecting metadata from {len(self._metadata_sources)} sources")
         meta_store = await self._collect_metadata(id_graph)
-        log.info(f"Metadata store contains {len(meta_store.items())} entries")
+        log.info(f"Metadata store contains {len(meta_store)} entries")
 
         log.info(f"Building episode graph from {len(self._episode_sources)} sources")
         episode_graph = self._build_episode_graph(meta_store, id_graph)
@@ -166,6 +167,10 @@ class MappingAggregator:
         else:
             log.info("Post-transitive validation produced no issues")
 
+        # Everything past this point only queries the graphs.
+        id_graph.freeze()
+        episode_graph.freeze()
+
         return AggregationArtifacts(
             id_graph=id_graph,
             meta_store=meta_store,
@@ -195,11 +200,21 @@ class MappingAggregator:
         if not self._metadata_sources:
             return store
 
-        async with asyncio.TaskGroup() as tg:
-            tasks = [
-                tg.create_task(provider.collect_metadata(id_graph))
-                for provider in self._metadata_sources
-            ]
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(provider.collect_metadata(id_graph))
+                    for provider in self._metadata_sources
+                ]
+        finally:
+            # Shared HTTP sessions are no longer needed once metadata is collected
+            await asyncio.gather(
+                *(
+                    provider.aclose()
+                    for provider in self._metadata_sources
+                    if isinstance(provider, CachedMetadataSource)
+                )
+            )
 
         results = [task.result() for task in tasks]
         for result in results:
@@ -1,6 +1,7 @@
 """Edit operations for overriding aggregated mappings."""
 
 import importlib.metadata
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,9 @@ log = logging.getLogger(__name__)
 
 type Scope = tuple[str, str, str | None]  # (provider, id, scope)
 
+# Bump whenever `_normalize_node` output changes, invalidating existing mirrors
+_NORMALIZED_CACHE_FORMAT = 1
+
 
 class EditError(Exception):
     """Base exception for edit validation errors."""
@@ -28,6 +32,11 @@ class DuplicateTargetError(EditError):
 def load_edits(edits_file: Path | str) -> dict[str, Any]:
     """Load edits from a YAML file.
 
+    The YAML file stays authoritative. After it is normalized, a JSON mirror is
+    written next to it and reused on later loads while the YAML file's size and
+    modification time match the ones recorded in the mirror and the mirror was
+    produced by the same package version and normalization format.
+
     Args:
         edits_file (Path | str): Path to the mappings.edits.yaml file.
 
@@ -42,6 +51,11 @@ def load_edits(edits_file: Path | str) -> dict[str, Any]:
         log.warning("Edits file not found: %s. Continuing without edits.", path)
         return {}
 
+    version = importlib.metadata.version("anibridge-mappings")
+    cached = _load_normalized_cache(path, version)
+    if cached is not None:
+        return cached
+
     try:
         yaml = YAML(typ="rt")
         yaml.preserve_quotes = True
@@ -49,15 +63,12 @@ def load_edits(edits_file: Path | str) -> dict[str, Any]:
             edits = yaml.load(f) or {}
 
         if isinstance(edits, CommentedMap):
-            edits["$schema"] = {
-                "version": DoubleQuotedScalarString(
-                    importlib.metadata.version("anibridge-mappings")
-                )
-            }
+            edits["$schema"] = {"version": DoubleQuotedScalarString(version)}
             # Recursively normalize: sort keys, enforce quotes at depth 2, add spacers
             formatted = _normalize_node(edits, depth=0)
             with path.open("w") as f:
                 yaml.dump(formatted, f)
+            _write_normalized_cache(path, formatted)
             return formatted
 
         return edits
@@ -65,6 +76,56 @@ def load_edits(edits_file: Path | str) -> dict[str, Any]:
         raise EditError(f"Failed to load edits file '{path}': {exc}") from exc
 
 
+def _normalized_cache_path(path: Path) -> Path:
+    """Return the JSON mirror path for an edits file."""
+    return path.with_name(f"{path.stem}.normalized.json")
+
+
+def _source_fingerprint(path: Path) -> list[int]:
+    """Return the size and nanosecond modification time of an edits file."""
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _load_normalized_cache(path: Path, version: str) -> dict[str, Any] | None:
+    """Return the JSON mirror of an edits file when it is still current."""
+    cache_path = _normalized_cache_path(path)
+    try:
+        fingerprint = _source_fingerprint(path)
+        with cache_path.open(encoding="utf-8") as f:
+            cached = json.load(f)
+    except OSError, ValueError:
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("format") != _NORMALIZED_CACHE_FORMAT:
+        return None
+    if cached.get("source") != fingerprint:
+        return None
+    edits = cached.get("edits")
+    if not isinstance(edits, dict):
+        return None
+    schema = edits.get("$schema")
+    if not isinstance(schema, dict) or schema.get("version") != version:
+        return None
+    return edits
+
+
+def _write_normalized_cache(path: Path, edits: dict[str, Any]) -> None:
+    """Write the JSON mirror of normalized edits, ignoring write failures."""
+    cache_path = _normalized_cache_path(path)
+    try:
+        payload = {
+            "format": _NORMALIZED_CACHE_FORMAT,
+            "source": _source_fingerprint(path),
+            "edits": edits,
+        }
+        with cache_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    except OSError as exc:
+        log.debug("Could not write edits cache %s: %s", cache_path, exc)
+
+
 def _normalize_node(node: CommentedMap, depth: int = 0) -> Any:
     """Recursively reconstructs CommentedMap to enforce sorting, quoting and spacing."""
     if not isinstance(node, (dict, CommentedMap)):
@@ -82,8 +143,11 @@ def _normalize_node(node: CommentedMap, depth: int = 0) -> Any:
     # Determine sort order
     keys = list(node.keys())
     if depth < 2:
-        # Sort Source (depth 0) and Target (depth 1) descriptors
-        keys.sort(key=provider_scope_sort_key)
+        # Sort Source (depth 0) and Target (depth 1) descriptors. Decorate once so
+        # the sort itself only compares precomputed key tuples.
+        decorated = [(provider_scope_sort_key(k), k) for k in keys]
+        decorated.sort()
+        keys = [k for _, k in decorated]
 
     for k in keys:
         v = node[k]
@@ -155,14 +219,16 @@ def apply_edits(
 
 def _parse_descriptor(descriptor: str) -> Scope:
     """Parses 'provider:id[:scope]' string into a tuple."""
-    parts = descriptor.split(":")
-    if len(parts) == 2:
-        provider, entry_id = parts
+    separators = descriptor.count(":")
+    if separators == 1:
+        provider, _, entry_id = descriptor.partition(":")
         if provider == "anidb":  # Special handling to normalize Anidb scope
             return provider, entry_id, "R"
         return provider, entry_id, None
-    if len(parts) == 3:
-        return parts[0], parts[1], parts[2]
+    if separators == 2:
+        provider, _, rest = descriptor.partition(":")
+        entry_id, _, scope = rest.partition(":")
+        return provider, entry_id, scope
     raise EditError(
         "Invalid descriptor: "
         f"'{descriptor}'. Expected 'provider:id' or 'provider:id:scope'"
@@ -192,10 +258,12 @@ def _clear_source_target_ranges(
     if not source_nodes or not target_nodes:
         return
 
+    neighbors = graph.neighbors
+    remove_edge = graph.remove_edge
     for src_node in source_nodes:
-        for neighbor in graph.neighbors(src_node):
+        for neighbor in neighbors(src_node):
             if neighbor in target_nodes:
-                graph.remove_edge(
+                remove_edge(
                     src_node,
                     neighbor,
                     provenance=ProvenanceContext(
@@ -1,27 +1,172 @@
 """Graph implementation to store and query mappings."""
 
-from collections import deque
-from collections.abc import Iterable, Iterator
+from array import array
+from collections.abc import Iterable, Iterator, Set
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, TypeVar
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, TypeVar, cast
 
 NodeT = TypeVar("NodeT")
 
+_EMPTY_IDS: frozenset[int] = frozenset()
+
+
+class _NodeSetView[NodeT](Set[NodeT]):
+    """Read-only set view over interned node IDs.
+
+    The view reflects later changes to the underlying ID set and must not be
+    used to mutate the graph.
+    """
+
+    __slots__ = ("_ids", "_node_ids", "_nodes")
+
+    def __init__(
+        self, node_ids: Set[int], nodes: list[NodeT], ids: dict[NodeT, int]
+    ) -> None:
+        """Wrap an ID set with the node tables used to translate it."""
+        self._node_ids = node_ids
+        self._nodes = nodes
+        self._ids = ids
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the view."""
+        return len(self._node_ids)
+
+    def __iter__(self) -> Iterator[NodeT]:
+        """Iterate over the nodes in the view."""
+        return map(self._nodes.__getitem__, self._node_ids)
+
+    def __contains__(self, node: object) -> bool:
+        """Check whether a node is in the view."""
+        node_id = self._ids.get(cast(NodeT, node))
+        return node_id is not None and node_id in self._node_ids
+
+
+@dataclass(slots=True, frozen=True)
+class _CsrAdjacency:
+    """Compressed sparse row adjacency built when a graph is frozen.
+
+    Neighbors of node ID `u` are `indices[indptr[u]:indptr[u + 1]]`, listed in
+    canonical order and ignoring edge direction. `order` lists live IDs in that
+    order and `rank` maps an ID to its position in it.
+    """
+
+    order: list[int]
+    rank: list[int]
+    indptr: array[int]
+    indices: array[int]
+
 
 class _BaseGraph[NodeT]:
-    """Lightweight graph with support for directed and undirected edges."""
+    """Lightweight graph with support for directed and undirected edges.
 
-    def __init__(self) -> None:
-        """Initialize empty adjacency and predecessor maps."""
-        self._adj: dict[NodeT, set[NodeT]] = {}
-        self._pred: dict[NodeT, set[NodeT]] = {}
+    Nodes are interned to dense integer IDs on first use. Adjacency is stored in
+    lists indexed by ID and translated back to nodes at the public API boundary.
+    IDs of removed nodes are never reused.
 
-    def _ensure_node(self, node: NodeT) -> None:
-        """Ensure a node exists in adjacency and predecessor maps."""
-        if node not in self._adj:
-            self._adj[node] = set()
-            self._pred[node] = set()
+    Connected components are tracked with a union-find structure that is updated
+    as edges are added, along with a root-to-members index once it has been
+    queried. Edge removal invalidates both; they are rebuilt from the adjacency
+    on the next component query. Components ignore edge direction.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty node tables and adjacency/predecessor maps."""
+        self._ids: dict[NodeT, int] = {}
+        self._nodes: list[NodeT] = []
+        self._adj: list[set[int]] = []
+        self._pred: list[set[int]] = []
+        self._parent: list[int] = []
+        self._rank: list[int] = []
+        self._dsu_valid = True
+        self._members: dict[int, list[int]] | None = None
+        self._csr: _CsrAdjacency | None = None
+        self._frozen = False
+        self._link_count: int | None = None
+
+    def _ensure_mutable(self) -> None:
+        """Raise if the graph has been frozen."""
+        if self._frozen:
+            raise RuntimeError("Graph is frozen and can no longer be modified.")
+
+    def _ensure_node(self, node: NodeT) -> int:
+        """Ensure a node exists in the graph and return its interned ID."""
+        try:
+            return self._ids[node]
+        except KeyError:
+            pass
+        self._ensure_mutable()
+        node_id = len(self._nodes)
+        self._ids[node] = node_id
+        self._nodes.append(node)
+        self._adj.append(set())
+        self._pred.append(set())
+        self._parent.append(node_id)
+        self._rank.append(0)
+        if self._members is not None:
+            self._members[node_id] = [node_id]
+        return node_id
+
+    def _find(self, node_id: int) -> int:
+        """Return the union-find root for `node_id`, compressing the path."""
+        parent = self._parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+
+    def _union(self, a_id: int, b_id: int) -> bool:
+        """Merge the components of two IDs; return True if they were distinct."""
+        root_a = self._find(a_id)
+        root_b = self._find(b_id)
+        if root_a == root_b:
+            return False
+        rank = self._rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        members = self._members
+        if members is not None:
+            # Splice the smaller member list onto the larger one
+            kept = members[root_a]
+            absorbed = members.pop(root_b)
+            if len(kept) < len(absorbed):
+                kept, absorbed = absorbed, kept
+                members[root_a] = kept
+            kept.extend(absorbed)
+        return True
+
+    def _invalidate_components(self) -> None:
+        """Drop union-find state after an edge or node removal."""
+        self._dsu_valid = False
+        self._members = None
+
+    def _rebuild_components(self) -> None:
+        """Rebuild union-find state from the current adjacency."""
+        self._parent = list(range(len(self._nodes)))
+        self._rank = [0] * len(self._nodes)
+        self._dsu_valid = True
+        adj = self._adj
+        for node_id in self._ids.values():
+            for neighbor_id in adj[node_id]:
+                self._union(node_id, neighbor_id)
+
+    def _component_index(self) -> dict[int, list[int]]:
+        """Return a mapping of union-find roots to component member IDs."""
+        if self._members is None:
+            if not self._dsu_valid:
+                self._rebuild_components()
+            members: dict[int, list[int]] = {}
+            find = self._find
+            for node_id in self._ids.values():
+                members.setdefault(find(node_id), []).append(node_id)
+            self._members = members
+        return self._members
 
     def add_edge(self, a: NodeT, b: NodeT, bidirectional: bool = True) -> None:
         """Add an edge between nodes.
@@ -31,16 +176,24 @@ class _BaseGraph[NodeT]:
             b (NodeT): End node.
             bidirectional (bool): If True, adds both directions.
         """
-        if a == b:
-            self._ensure_node(a)
-            return
-        self._ensure_node(a)
-        self._ensure_node(b)
-        self._adj[a].add(b)
-        self._pred[b].add(a)
+        self._ensure_mutable()
+        self._link(self._ensure_node(a), self._ensure_node(b), bidirectional)
+
+    def _link(self, a_id: int, b_id: int, bidirectional: bool) -> bool:
+        """Add an edge between two interned IDs; return True if one existed."""
+        adj = self._adj
+        existed = b_id in adj[a_id] or a_id in adj[b_id]
+        if a_id == b_id:
+            return existed
+        pred = self._pred
+        adj[a_id].add(b_id)
+        pred[b_id].add(a_id)
         if bidirectional:
-            self._adj[b].add(a)
-            self._pred[a].add(b)
+            adj[b_id].add(a_id)
+            pred[a_id].add(b_id)
+        if self._dsu_valid:
+            self._union(a_id, b_id)
+        return existed
 
     def has_edge(self, a: NodeT, b: NodeT) -> bool:
         """Check if an edge exists between `a` and `b`.
@@ -52,7 +205,11 @@ class _BaseGraph[NodeT]:
         Returns:
             bool: True if an edge exists in either direction.
         """
-        return b in self._adj.get(a, set()) or a in self._adj.get(b, set())
+        a_id = self._ids.get(a)
+        b_id = self._ids.get(b)
+        if a_id is None or b_id is None:
+            return False
+        return b_id in self._adj[a_id] or a_id in self._adj[b_id]
 
     def add_equivalence_class(self, nodes: Iterable[NodeT]) -> None:
         """Add an undirected equivalence class of nodes.
@@ -60,14 +217,30 @@ class _BaseGraph[NodeT]:
         Args:
             nodes (Iterable[NodeT]): Nodes to connect together.
         """
-        unique = list(dict.fromkeys(nodes))
-        if len(unique) <= 1:
-            for node in unique:
-                self._ensure_node(node)
+        ensure_node = self._ensure_node
+        seen: set[int] = set()
+        member_ids: list[int] = []
+        for node in nodes:
+            node_id = ensure_node(node)
+            if node_id not in seen:
+                seen.add(node_id)
+                member_ids.append(node_id)
+        if len(member_ids) <= 1:
             return
-        base = unique[0]
-        for other in unique[1:]:
-            self.add_edge(base, other, bidirectional=True)
+        self._ensure_mutable()
+
+        # Connect every member to the first one in a single pass
+        base_id, *other_ids = member_ids
+        adj = self._adj
+        pred = self._pred
+        adj[base_id].update(other_ids)
+        pred[base_id].update(other_ids)
+        for other_id in other_ids:
+            adj[other_id].add(base_id)
+            pred[other_id].add(base_id)
+        if self._dsu_valid:
+            for other_id in other_ids:
+                self._union(base_id, other_id)
 
     def add_graph(self, other: _BaseGraph[NodeT]) -> None:
         """Merge another graph's edges into this graph.
@@ -75,15 +248,28 @@ class _BaseGraph[NodeT]:
         Args:
             other (_BaseGraph[NodeT]): Graph to merge.
         """
-        for node in other.nodes():
-            self._ensure_node(node)
-        for node in other.nodes():
-            for neighbor in other.neighbors(node):
-                # We assume if it's in neighbors, it's an edge.
-                # We don't know if it was bidirectional in the source,
-                # but we can just add it as directed here.
-                # If the source had it bidirectional, we'll see the reverse edge later.
-                self.add_edge(node, neighbor, bidirectional=False)
+        self._ensure_mutable()
+        if other is self:
+            return
+        # Translate the other graph's IDs into ours, then splice adjacency sets
+        # directly. Edges keep their direction from the source graph.
+        id_map: dict[int, int] = {}
+        for node, other_id in other._ids.items():
+            id_map[other_id] = self._ensure_node(node)
+        adj = self._adj
+        pred = self._pred
+        other_adj = other._adj
+        other_pred = other._pred
+        for other_id, node_id in id_map.items():
+            adj[node_id].update([id_map[n] for n in other_adj[other_id]])
+            pred[node_id].update([id_map[n] for n in other_pred[other_id]])
+
+        # Components of the other graph stay connected after the merge
+        if self._dsu_valid:
+            for member_ids in other._component_index().values():
+                base_id = id_map[member_ids[0]]
+                for member_id in member_ids[1:]:
+                    self._union(base_id, id_map[member_id])
 
     def has_node(self, node: NodeT) -> bool:
         """Check if a node exists in the graph.
@@ -91,7 +277,7 @@ class _BaseGraph[NodeT]:
         Args:
             node (NodeT): Node to check.
         """
-        return node in self._adj
+        return node in self._ids
 
     def neighbors(self, node: NodeT) -> set[NodeT]:
         """Return the neighbor set for a node.
@@ -99,7 +285,24 @@ class _BaseGraph[NodeT]:
         Args:
             node (NodeT): Node to inspect.
         """
-        return self._adj.get(node, set()).copy()
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return set()
+        nodes = self._nodes
+        return {nodes[neighbor_id] for neighbor_id in self._adj[node_id]}
+
+    def neighbors_view(self, node: NodeT) -> Set[NodeT]:
+        """Return a read-only view of the neighbors of a node.
+
+        Unlike `neighbors`, no set is allocated; the view must not be held
+        across mutations of the graph.
+
+        Args:
+            node (NodeT): Node to inspect.
+        """
+        node_id = self._ids.get(node)
+        node_ids = _EMPTY_IDS if node_id is None else self._adj[node_id]
+        return _NodeSetView(node_ids, self._nodes, self._ids)
 
     def remove_edge(self, a: NodeT, b: NodeT) -> None:
         """Remove an edge between `a` and `b` if present (both directions).
@@ -108,35 +311,56 @@ class _BaseGraph[NodeT]:
             a (NodeT): Start node.
             b (NodeT): End node.
         """
-        if a in self._adj:
-            self._adj[a].discard(b)
-        if b in self._pred:
-            self._pred[b].discard(a)
-        if b in self._adj:
-            self._adj[b].discard(a)
-        if a in self._pred:
-            self._pred[a].discard(b)
+        self._ensure_mutable()
+        a_id = self._ids.get(a)
+        b_id = self._ids.get(b)
+        if a_id is not None and b_id is not None:
+            self._unlink(a_id, b_id)
+
+    def _unlink(self, a_id: int, b_id: int) -> bool:
+        """Remove edges between two interned IDs; return True if one existed."""
+        adj = self._adj
+        pred = self._pred
+        existed = b_id in adj[a_id] or a_id in adj[b_id]
+        if existed:
+            self._invalidate_components()
+        adj[a_id].discard(b_id)
+        pred[b_id].discard(a_id)
+        adj[b_id].discard(a_id)
+        pred[a_id].discard(b_id)
+        return existed
+
+    def _component_ids(self, start_id: int) -> list[int]:
+        """Return the IDs in the connected component containing `start_id`."""
+        return self._component_index()[self._find(start_id)]
 
     def get_component(self, start: NodeT) -> set[NodeT]:
         """Return the connected component containing `start`.
 
+        Edge direction is ignored, so a node reachable only through incoming
+        directed edges is still part of the component.
+
         Args:
             start (NodeT): Node to start the traversal from.
 
         Returns:
             set[NodeT]: Nodes in the connected component.
         """
-        if start not in self._adj:
+        start_id = self._ids.get(start)
+        if start_id is None:
             return set()
-        visited: set[NodeT] = set()
-        queue: deque[NodeT] = deque([start])
-        while queue:
-            node = queue.popleft()
-            if node in visited:
-                continue
-            visited.add(node)
-            queue.extend(nb for nb in self._adj[node] if nb not in visited)
-        return visited
+        nodes = self._nodes
+        return {nodes[node_id] for node_id in self._component_ids(start_id)}
+
+    def components(self) -> Iterator[set[NodeT]]:
+        """Yield every connected component in the graph, ignoring edge direction.
+
+        Yields:
+            set[NodeT]: Nodes in one connected component.
+        """
+        nodes = self._nodes
+        for member_ids in list(self._component_index().values()):
+            yield {nodes[node_id] for node_id in member_ids}
 
     def node_count(self) -> int:
         """Return the total number of nodes in the graph.
@@ -144,7 +368,24 @@ class _BaseGraph[NodeT]:
         Returns:
             int: Node count.
         """
-        return len(self._adj)
+        return len(self._ids)
+
+    def link_count(self) -> int:
+        """Return the number of directed adjacency links in the graph.
+
+        Undirected edges count once per direction. The count is cached once the
+        graph is frozen.
+
+        Returns:
+            int: Link count.
+        """
+        if self._link_count is not None:
+            return self._link_count
+        adj = self._adj
+        count = sum(len(adj[node_id]) for node_id in self._ids.values())
+        if self._frozen:
+            self._link_count = count
+        return count
 
     def nodes(self) -> set[NodeT]:
         """Return all nodes in the graph.
@@ -152,7 +393,7 @@ class _BaseGraph[NodeT]:
         Returns:
             set[NodeT]: Nodes in the graph.
         """
-        return set(self._adj)
+        return set(self._ids)
 
     def remove_node(self, node: NodeT) -> None:
         """Remove a node and all incident edges.
@@ -160,25 +401,90 @@ class _BaseGraph[NodeT]:
         Args:
             node (NodeT): Node to remove.
         """
-        if node not in self._adj:
+        self._ensure_mutable()
+        node_id = self._ids.pop(node, None)
+        if node_id is None:
             return
+        self._invalidate_components()
 
         # Remove outgoing edges
-        for neighbor in self._adj[node]:
-            self._pred[neighbor].discard(node)
+        for neighbor_id in self._adj[node_id]:
+            self._pred[neighbor_id].discard(node_id)
 
         # Remove incoming edges
-        for predecessor in self._pred[node]:
-            self._adj[predecessor].discard(node)
+        for predecessor_id in self._pred[node_id]:
+            self._adj[predecessor_id].discard(node_id)
+
+        self._adj[node_id].clear()
+        self._pred[node_id].clear()
+
+    def _canonical_order(self) -> list[int]:
+        """Return live node IDs in the order used by frozen traversals."""
+        return sorted(self._ids.values())
+
+    def _canonical_ranks(self) -> tuple[list[int], list[int]]:
+        """Return live IDs in canonical order and a rank lookup indexed by ID."""
+        order = self._canonical_order()
+        rank = [0] * len(self._nodes)
+        for position, node_id in enumerate(order):
+            rank[node_id] = position
+        return order, rank
+
+    def freeze(self) -> None:
+        """Make the graph read-only for the query phase.
+
+        Adjacency sets are replaced with frozensets and a CSR view of the
+        adjacency is built for bulk traversals. The component index is built
+        up front with every node pointing directly at its root, so component
+        queries never touch union-find state afterwards. Any later mutation
+        raises `RuntimeError`.
+        """
+        if self._frozen:
+            return
+        self._adj = cast(list[set[int]], [frozenset(nbrs) for nbrs in self._adj])
+        self._pred = cast(list[set[int]], [frozenset(preds) for preds in self._pred])
+        self._csr = self._build_csr()
+        self._component_index()
+        find = self._find
+        self._parent = [find(node_id) for node_id in range(len(self._nodes))]
+        self._frozen = True
+
+    def _build_csr(self) -> _CsrAdjacency:
+        """Build a CSR adjacency with neighbors listed in canonical order."""
+        order, rank = self._canonical_ranks()
+        by_rank = rank.__getitem__
+        indptr = array("q", [0])
+        indices = array("q")
+        for nbrs, preds in zip(self._adj, self._pred, strict=True):
+            indices.extend(sorted(nbrs | preds, key=by_rank))
+            indptr.append(len(indices))
+        return _CsrAdjacency(order=order, rank=rank, indptr=indptr, indices=indices)
+
+    @property
+    def frozen(self) -> bool:
+        """Return True once `freeze` has been called.
 
-        del self._adj[node]
-        del self._pred[node]
+        Returns:
+            bool: Whether the graph is read-only.
+        """
+        return self._frozen
 
 
 IdNode = tuple[str, str, str | None]  # (provider, id, scope)
 EpisodeNode = tuple[str, str, str | None, str]  # (provider, id, scope, episode_range)
 
 
+def _episode_node_key(node: EpisodeNode) -> tuple[str, str, str, str]:
+    """Build the string sort key for an episode node."""
+    provider, entry_id, scope, episode_range = node
+    return (
+        str(provider),
+        str(entry_id),
+        "" if scope is None else str(scope),
+        str(episode_range),
+    )
+
+
 @dataclass(slots=True)
 class ProvenanceContext:
     """Context used to record provenance events."""
@@ -202,6 +508,60 @@ class ProvenanceEvent:
     details: dict[str, Any] | None = None
 
 
+@dataclass(slots=True)
+class _ProvenanceLog:
+    """Columnar store of provenance events.
+
+    Each column is indexed by event ID, which is the event's `seq` minus one.
+    `by_edge` lists the event IDs recorded for each undirected edge.
+    """
+
+    actions: list[str] = field(default_factory=list)
+    stages: list[str] = field(default_factory=list)
+    actors: list[str | None] = field(default_factory=list)
+    reasons: list[str | None] = field(default_factory=list)
+    effective: bytearray = field(default_factory=bytearray)
+    details: list[dict[str, Any] | None] = field(default_factory=list)
+    by_edge: dict[frozenset[EpisodeNode], array[int]] = field(default_factory=dict)
+
+    def record(
+        self,
+        key: frozenset[EpisodeNode],
+        action: str,
+        stage: str,
+        actor: str | None,
+        reason: str | None,
+        effective: bool,
+        details: dict[str, Any] | None,
+    ) -> None:
+        """Append an event and attach it to an edge."""
+        event_ids = self.by_edge.get(key)
+        if event_ids is None:
+            event_ids = self.by_edge[key] = array("q")
+        event_ids.append(len(self.actions))
+        self.actions.append(action)
+        self.stages.append(stage)
+        self.actors.append(actor)
+        self.reasons.append(reason)
+        self.effective.append(effective)
+        self.details.append(details)
+
+    def events(self, event_ids: Iterable[int]) -> list[ProvenanceEvent]:
+        """Materialize the events with the given IDs."""
+        return [
+            ProvenanceEvent(
+                seq=event_id + 1,
+                action=self.actions[event_id],
+                stage=self.stages[event_id],
+                actor=self.actors[event_id],
+                reason=self.reasons[event_id],
+                effective=bool(self.effective[event_id]),
+                details=self.details[event_id],
+            )
+            for event_id in event_ids
+        ]
+
+
 class IdMappingGraph(_BaseGraph[IdNode]):
     """Undirected graph of provider IDs."""
 
@@ -229,28 +589,38 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
     def __init__(self) -> None:
         """Initialize empty graph with provenance tracking."""
         super().__init__()
-        self._provenance: dict[
-            tuple[EpisodeNode, EpisodeNode], list[ProvenanceEvent]
-        ] = {}
-        self._provenance_seq = 0
+        self._sort_keys: list[tuple[str, str, str, str]] = []
+        self._detached_keys: dict[EpisodeNode, tuple[str, str, str, str]] = {}
+        self._provenance = _ProvenanceLog()
         self._provenance_context: ProvenanceContext | None = None
 
+    def _ensure_node(self, node: EpisodeNode) -> int:
+        """Ensure a node exists and precompute its sort key on first insert."""
+        try:
+            return self._ids[node]
+        except KeyError:
+            pass
+        node_id = super()._ensure_node(node)
+        self._sort_keys.append(_episode_node_key(node))
+        return node_id
+
+    def _canonical_order(self) -> list[int]:
+        """Return live node IDs ordered by their sort keys."""
+        return sorted(self._ids.values(), key=self._sort_keys.__getitem__)
+
     def _node_key(self, node: EpisodeNode) -> tuple[str, str, str, str]:
-        """Key function for sorting nodes."""
-        provider, entry_id, scope, episode_range = node
-        return (
-            str(provider),
-            str(entry_id),
-            "" if scope is None else str(scope),
-            str(episode_range),
-        )
+        """Key function for sorting nodes.
 
-    def _edge_key(
-        self, a: EpisodeNode, b: EpisodeNode
-    ) -> tuple[EpisodeNode, EpisodeNode]:
-        """Key function for sorting undirected edges."""
-        left, right = sorted((a, b), key=self._node_key)
-        return (left, right)
+        Keys of live nodes are precomputed on insert. Nodes that only appear in
+        provenance (removed, or never added) are memoized separately.
+        """
+        node_id = self._ids.get(node)
+        if node_id is not None:
+            return self._sort_keys[node_id]
+        key = self._detached_keys.get(node)
+        if key is None:
+            key = self._detached_keys[node] = _episode_node_key(node)
+        return key
 
     def _record_event(
         self,
@@ -272,18 +642,9 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             merged_details = dict(ctx.details)
         if details:
             merged_details = {**(merged_details or {}), **details}
-        self._provenance_seq += 1
-        event = ProvenanceEvent(
-            seq=self._provenance_seq,
-            action=action,
-            stage=stage,
-            actor=actor,
-            reason=reason,
-            effective=effective,
-            details=merged_details,
+        self._provenance.record(
+            frozenset((a, b)), action, stage, actor, reason, effective, merged_details
         )
-        key = self._edge_key(a, b)
-        self._provenance.setdefault(key, []).append(event)
 
     def add_edge(
         self,
@@ -303,8 +664,8 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             provenance (ProvenanceContext | None): Context for the addition.
             details (dict[str, Any] | None): Additional details for the event.
         """
-        existed = self.has_edge(a, b)
-        super().add_edge(a, b, bidirectional=bidirectional)
+        self._ensure_mutable()
+        existed = self._link(self._ensure_node(a), self._ensure_node(b), bidirectional)
         self._record_event(
             "add",
             a,
@@ -314,6 +675,56 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             details=details,
         )
 
+    def add_edges_bulk(
+        self,
+        pairs: Iterable[tuple[EpisodeNode, EpisodeNode]],
+        *,
+        provenance: ProvenanceContext | None = None,
+    ) -> None:
+        """Add many bidirectional edges sharing a single provenance context.
+
+        Equivalent to calling `add_edge` for each pair, but the context is
+        resolved once for the whole batch and events are numbered sequentially.
+
+        Args:
+            pairs (Iterable[tuple[EpisodeNode, EpisodeNode]]): Edges to add.
+            provenance (ProvenanceContext | None): Context for the additions.
+        """
+        self._ensure_mutable()
+        ctx = provenance or self._provenance_context
+        stage = ctx.stage if ctx else "unknown"
+        actor = ctx.actor if ctx else None
+        reason = ctx.reason if ctx else None
+        details = dict(ctx.details) if ctx and ctx.details else None
+
+        ensure_node = self._ensure_node
+        link = self._link
+        record = self._provenance.record
+        for a, b in pairs:
+            existed = link(ensure_node(a), ensure_node(b), True)
+            record(
+                frozenset((a, b)),
+                "add",
+                stage,
+                actor,
+                reason,
+                not existed,
+                None if details is None else dict(details),
+            )
+
+    def add_equivalence_class(self, nodes: Iterable[EpisodeNode]) -> None:
+        """Add an undirected equivalence class of nodes with provenance.
+
+        Args:
+            nodes (Iterable[EpisodeNode]): Nodes to connect together.
+        """
+        unique = list(dict.fromkeys(nodes))
+        for node in unique:
+            self._ensure_node(node)
+        if len(unique) > 1:
+            base = unique[0]
+            self.add_edges_bulk((base, other) for other in unique[1:])
+
     def remove_edge(
         self,
         a: EpisodeNode,
@@ -330,8 +741,12 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             provenance (ProvenanceContext | None): Context for the removal.
             details (dict[str, Any] | None): Additional details for the event.
         """
-        existed = self.has_edge(a, b)
-        super().remove_edge(a, b)
+        self._ensure_mutable()
+        a_id = self._ids.get(a)
+        b_id = self._ids.get(b)
+        existed = False
+        if a_id is not None and b_id is not None:
+            existed = self._unlink(a_id, b_id)
         self._record_event(
             "remove",
             a,
@@ -354,18 +769,46 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
     def iter_edges(self) -> list[tuple[EpisodeNode, EpisodeNode]]:
         """Return unique undirected edges for this graph.
 
+        Edges are oriented and ordered by the sort keys of their endpoints.
+
         Returns:
             list[tuple[EpisodeNode, EpisodeNode]]: List of unique edges.
         """
-        seen: set[tuple[EpisodeNode, EpisodeNode]] = set()
+        if self._csr is not None:
+            return self._iter_csr_edges(self._csr)
+        order, rank = self._canonical_ranks()
+        size = len(order)
+        codes: set[int] = set()
+        for node_id in order:
+            node_rank = rank[node_id]
+            for neighbor_id in self._adj[node_id]:
+                neighbor_rank = rank[neighbor_id]
+                if node_rank < neighbor_rank:
+                    codes.add(node_rank * size + neighbor_rank)
+                else:
+                    codes.add(neighbor_rank * size + node_rank)
+        nodes = self._nodes
+        return [
+            (nodes[order[code // size]], nodes[order[code % size]])
+            for code in sorted(codes)
+        ]
+
+    def _iter_csr_edges(
+        self, csr: _CsrAdjacency
+    ) -> list[tuple[EpisodeNode, EpisodeNode]]:
+        """Return unique undirected edges by scanning the frozen CSR adjacency."""
+        nodes = self._nodes
+        rank = csr.rank
+        indptr = csr.indptr
+        indices = csr.indices
         edges: list[tuple[EpisodeNode, EpisodeNode]] = []
-        for node in sorted(self.nodes(), key=self._node_key):
-            for neighbor in sorted(self.neighbors(node), key=self._node_key):
-                key = self._edge_key(node, neighbor)
-                if key in seen:
-                    continue
-                seen.add(key)
-                edges.append(key)
+        for u in csr.order:
+            u_rank = rank[u]
+            edges.extend(
+                (nodes[u], nodes[v])
+                for v in indices[indptr[u] : indptr[u + 1]]
+                if u_rank < rank[v]
+            )
         return edges
 
     def add_graph(
@@ -381,18 +824,12 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             provenance (ProvenanceContext | None): Context for the additions.
         """
         if isinstance(other, EpisodeMappingGraph):
-            for source_node, target_node in other.iter_edges():
-                self.add_edge(
-                    source_node,
-                    target_node,
-                    bidirectional=True,
-                    provenance=provenance,
-                )
+            self.add_edges_bulk(other.iter_edges(), provenance=provenance)
             return
         for node in other.nodes():
             self._ensure_node(node)
         for node in other.nodes():
-            for neighbor in other.neighbors(node):
+            for neighbor in other.neighbors_view(node):
                 self.add_edge(
                     node,
                     neighbor,
@@ -409,18 +846,75 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
             list[tuple[EpisodeNode, EpisodeNode, list[ProvenanceEvent]]]: List of edges
                 with events.
         """
-        items: list[tuple[EpisodeNode, EpisodeNode, list[ProvenanceEvent]]] = []
-        seen: set[tuple[EpisodeNode, EpisodeNode]] = set()
-        for edge in self.iter_edges():
-            if edge in self._provenance:
-                items.append((edge[0], edge[1], list(self._provenance[edge])))
-                seen.add(edge)
-        for edge, events in self._provenance.items():
-            if edge in seen:
-                continue
-            items.append((edge[0], edge[1], list(events)))
-        items.sort(key=lambda item: (self._node_key(item[0]), self._node_key(item[1])))
-        return items
+        log = self._provenance
+        return [
+            (left, right, log.events(event_ids))
+            for left, right, event_ids in self._oriented_provenance()
+        ]
+
+    def provenance_groups(
+        self,
+    ) -> list[tuple[IdNode, IdNode, list[tuple[ProvenanceEvent, str, str]]]]:
+        """Return provenance grouped by the entries each edge connects.
+
+        Edges are oriented as in `provenance_items`. Every group lists its events
+        across all episode ranges in recording order, each paired with the
+        source and target range of its edge.
+
+        Returns:
+            list[tuple[IdNode, IdNode, list[tuple[ProvenanceEvent, str, str]]]]:
+                Source entry, target entry, and ordered events.
+        """
+        groups: dict[tuple[IdNode, IdNode], list[tuple[int, str, str]]] = {}
+        for left, right, event_ids in self._oriented_provenance():
+            rows = groups.setdefault((left[:3], right[:3]), [])
+            source_range = left[3]
+            target_range = right[3]
+            rows.extend(
+                (event_id, source_range, target_range) for event_id in event_ids
+            )
+
+        log = self._provenance
+        result: list[tuple[IdNode, IdNode, list[tuple[ProvenanceEvent, str, str]]]] = []
+        for (source, target), rows in groups.items():
+            # Event IDs follow recording order, so sort on them directly
+            rows.sort(key=itemgetter(0))
+            events = log.events(row[0] for row in rows)
+            result.append(
+                (
+                    source,
+                    target,
+                    [
+                        (event, source_range, target_range)
+                        for event, (_, source_range, target_range) in zip(
+                            events, rows, strict=True
+                        )
+                    ],
+                )
+            )
+        return result
+
+    def _oriented_provenance(
+        self,
+    ) -> list[tuple[EpisodeNode, EpisodeNode, array[int]]]:
+        """Return recorded edges oriented and ordered by their endpoint keys."""
+        node_key = self._node_key
+        keyed: list[tuple[tuple[Any, Any], EpisodeNode, EpisodeNode, array[int]]] = []
+        for key, event_ids in self._provenance.by_edge.items():
+            if len(key) == 1:
+                (left,) = key
+                right = left
+            else:
+                left, right = key
+            left_key = node_key(left)
+            right_key = node_key(right)
+            # Orient each edge by the sort keys of its endpoints
+            if right_key < left_key:
+                left, right = right, left
+                left_key, right_key = right_key, left_key
+            keyed.append(((left_key, right_key), left, right, event_ids))
+        keyed.sort(key=itemgetter(0))
+        return [(left, right, event_ids) for _, left, right, event_ids in keyed]
 
     def add_transitive_edges(
         self, *, provenance: ProvenanceContext | None = None
@@ -430,28 +924,31 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
         Returns:
             int: Number of new edges added.
         """
-        visited: set[EpisodeNode] = set()
+        nodes = self._nodes
+        adj = self._adj
+        sort_key = self._sort_keys.__getitem__
         added = 0
-        for node in self.nodes():
-            if node in visited:
+        for member_ids in list(self._component_index().values()):
+            if len(member_ids) < 2:
                 continue
-            component = self.get_component(node)
-            visited.update(component)
-            if len(component) < 2:
-                continue
-            nodes = sorted(component, key=self._node_key)
-            for idx, source in enumerate(nodes):
-                for target in nodes[idx + 1 :]:
-                    if target in self._adj.get(source, set()):
-                        continue
-                    if any(c in (",", "|") for c in source[3]) or any(
-                        c in (",", "|") for c in target[3]
-                    ):
-                        # Complex range, skip creating a transitive edge
+            # Complex ranges never get transitive edges, so leave them out
+            ordered = sorted(
+                (
+                    node_id
+                    for node_id in member_ids
+                    if "," not in nodes[node_id][3] and "|" not in nodes[node_id][3]
+                ),
+                key=sort_key,
+            )
+            for idx, source_id in enumerate(ordered):
+                source = nodes[source_id]
+                source_adj = adj[source_id]
+                for target_id in ordered[idx + 1 :]:
+                    if target_id in source_adj:
                         continue
                     self.add_edge(
                         source,
-                        target,
+                        nodes[target_id],
                         bidirectional=True,
                         provenance=provenance,
                     )
@@ -469,10 +966,25 @@ class EpisodeMappingGraph(_BaseGraph[EpisodeNode]):
         Returns:
             dict[str, dict[str, dict[str | None, set[str]]]]: Grouped mappings.
         """
-        component = self.get_component(start)
         grouped: dict[str, dict[str, dict[str | None, set[str]]]] = {}
-        for provider, entry_id, scope, episode_range in component:
-            entry_group = grouped.setdefault(provider, {})
-            scope_group = entry_group.setdefault(entry_id, {})
-            scope_group.setdefault(scope, set()).add(episode_range)
+        start_id = self._ids.get(start)
+        if start_id is None:
+            return grouped
+        member_ids = self._component_ids(start_id)
+        if self._csr is not None:
+            # Canonical order keeps each provider/entry/scope group contiguous
+            member_ids = sorted(member_ids, key=self._csr.rank.__getitem__)
+
+        nodes = self._nodes
+        last_key: IdNode | None = None
+        ranges: set[str] = set()
+        for node_id in member_ids:
+            provider, entry_id, scope, episode_range = nodes[node_id]
+            key = (provider, entry_id, scope)
+            if key != last_key:
+                entry_group = grouped.setdefault(provider, {})
+                scope_group = entry_group.setdefault(entry_id, {})
+                ranges = scope_group.setdefault(scope, set())
+                last_key = key
+            ranges.add(episode_range)
         return grouped
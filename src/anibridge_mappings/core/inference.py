@@ -1,15 +1,22 @@
 """Inference helpers for metadata-backed episode mappings."""
 
 from collections.abc import Iterable
-from itertools import combinations
+from functools import lru_cache
+from itertools import combinations, product
 from logging import getLogger
 
-from anibridge_mappings.core.graph import EpisodeMappingGraph, IdMappingGraph, IdNode
+from anibridge_mappings.core.graph import (
+    EpisodeMappingGraph,
+    EpisodeNode,
+    IdMappingGraph,
+    IdNode,
+)
 from anibridge_mappings.core.meta import MetaStore, SourceMeta, SourceType
 
 log = getLogger(__name__)
 
 MetaKey = tuple[SourceType | None, int | None, int | None, int | None]
+MetaBucket = tuple[SourceType | None, int, int | None]  # (type, episodes, year)
 
 
 def infer_episode_mappings(
@@ -31,25 +38,48 @@ def infer_episode_mappings(
         return inferred
 
     for component in components:
-        # Gather all meta for nodes in the component
-        meta_nodes: list[tuple[SourceMeta, IdNode]] = []
+        # Bucket nodes by the fields that must match exactly, so only nodes that
+        # can possibly match are compared. Within a bucket, nodes sharing the
+        # same metadata key are grouped so each distinct key is matched once.
+        buckets: dict[MetaBucket, dict[MetaKey, tuple[SourceMeta, list[IdNode]]]] = {}
         for provider, entry_id, scope in component:
             meta = meta_store.peek(provider, entry_id, scope)
             if meta is None:
                 continue
             if meta.episodes is None or meta.episodes <= 0:
                 continue
-            meta_nodes.append((meta, (provider, entry_id, scope)))
-
-        # Try all pairs for matching
-        for (meta1, node1), (meta2, node2) in combinations(meta_nodes, 2):
-            if _meta_match(meta1, meta2):
-                episode_range = _range_from_meta_key(_meta_key(meta1))
-                if episode_range is None:
+            if meta.type == SourceType.MOVIE:
+                # Movies only match with a known year and duration
+                if not meta.start_year or not meta.duration:
                     continue
-                left_node = (*node1, episode_range)
-                right_node = (*node2, episode_range)
-                inferred.add_edge(left_node, right_node)
+                bucket = (meta.type, meta.episodes, meta.start_year)
+            else:
+                bucket = (meta.type, meta.episodes, None)
+            groups = buckets.setdefault(bucket, {})
+            meta_key = _meta_key(meta)
+            group = groups.get(meta_key)
+            if group is None:
+                groups[meta_key] = (meta, [(provider, entry_id, scope)])
+            else:
+                group[1].append((provider, entry_id, scope))
+
+        pairs: list[tuple[EpisodeNode, EpisodeNode]] = []
+        for groups in buckets.values():
+            episode_range = _range_from_meta_key(next(iter(groups)))
+            if episode_range is None:
+                continue
+            keyed = [
+                (meta, [(*node, episode_range) for node in nodes])
+                for meta, nodes in groups.values()
+            ]
+            for idx, (meta1, nodes1) in enumerate(keyed):
+                # Identical metadata always matches
+                pairs.extend(combinations(nodes1, 2))
+                for meta2, nodes2 in keyed[idx + 1 :]:
+                    if _meta_match(meta1, meta2):
+                        pairs.extend(product(nodes1, nodes2))
+        if pairs:
+            inferred.add_edges_bulk(pairs)
 
     if inferred.node_count():
         log.info(
@@ -67,39 +97,33 @@ def _meta_key(meta: SourceMeta) -> MetaKey:
 def _meta_match(meta1: SourceMeta, meta2: SourceMeta) -> bool:
     """Check if two SourceMeta objects match under our inference rules."""
     # Type and episodes must match exactly
-    if meta1.type != meta2.type:
-        return False
-    if meta1.episodes != meta2.episodes:
+    if (meta1.type, meta1.episodes) != (meta2.type, meta2.episodes):
         return False
 
     y1, y2 = meta1.start_year, meta2.start_year
-    if meta1.type == SourceType.MOVIE and (not y1 or not y2 or y1 != y2):
-        return False
-    if meta1.type == SourceType.TV and (y1 and y2) and (y1 != y2):
-        return False
-
     d1, d2 = meta1.duration, meta2.duration
-    relative_d = _relative_delta(d1, d2)
-    if meta1.type == SourceType.MOVIE and (not d1 or not d2 or relative_d > 0.1):
-        return False
-    if meta1.type == SourceType.TV and (d1 and d2) and (relative_d > 0.1):  # noqa: SIM103
-        return False
-
+    if meta1.type == SourceType.MOVIE:
+        # Movies need both years and durations to be known
+        if not y1 or not y2 or y1 != y2:
+            return False
+        if not d1 or not d2:
+            return False
+        return not _durations_differ(d1, d2)
+    if meta1.type == SourceType.TV:
+        # Shows only compare the fields known on both sides
+        if y1 and y2 and y1 != y2:
+            return False
+        if d1 and d2 and _durations_differ(d1, d2):
+            return False
     return True
 
 
-def _relative_delta(a: int | None, b: int | None) -> float:
-    """Calculate relative delta between two integer values."""
-    if a is None or b is None:
-        return -1.0
-    if a == 0 and b == 0:
-        return 0.0
-    denominator = max(abs(a), abs(b))
-    if denominator == 0:
-        return 0.0
-    return abs(a - b) / denominator
+def _durations_differ(d1: int, d2: int) -> bool:
+    """Check if two non-zero durations differ by more than 10%."""
+    return abs(d1 - d2) * 10 > max(abs(d1), abs(d2))
 
 
+@lru_cache(maxsize=4096)
 def _range_from_meta_key(meta_key: MetaKey) -> str | None:
     """Convert a metadata key to a normalized episode range string."""
     _meta_type, episodes, _duration, _start_year = meta_key
@@ -110,10 +134,4 @@ def _range_from_meta_key(meta_key: MetaKey) -> str | None:
 
 def _iter_components(id_graph: IdMappingGraph) -> Iterable[set[IdNode]]:
     """Yield unique connected components from an ID graph."""
-    visited: set[IdNode] = set()
-    for node in id_graph.nodes():
-        if node in visited:
-            continue
-        component = id_graph.get_component(node)
-        visited.update(component)
-        yield component
+    return id_graph.components()
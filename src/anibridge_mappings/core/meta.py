@@ -1,5 +1,6 @@
 """Metadata structures and store definitions."""
 
+import sys
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum
@@ -31,15 +32,24 @@ class SourceMeta:
         Returns:
             dict[str, Any]: JSON-friendly metadata.
         """
-        payload: dict[str, Any] = {
-            "type": self.type.value if self.type else None,
-            "episodes": self.episodes,
-            "duration": self.duration,
-            "start_year": self.start_year,
-        }
         if include_none:
-            return payload
-        return {key: value for key, value in payload.items() if value is not None}
+            return {
+                "type": self.type.value if self.type else None,
+                "episodes": self.episodes,
+                "duration": self.duration,
+                "start_year": self.start_year,
+            }
+        # Build the compact form directly instead of filtering the full one
+        payload: dict[str, Any] = {}
+        if self.type:
+            payload["type"] = self.type.value
+        if self.episodes is not None:
+            payload["episodes"] = self.episodes
+        if self.duration is not None:
+            payload["duration"] = self.duration
+        if self.start_year is not None:
+            payload["start_year"] = self.start_year
+        return payload
 
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> SourceMeta:
@@ -61,18 +71,32 @@ class SourceMeta:
         )
 
 
+EntryKey = tuple[str, str, str | None]  # (provider, id, scope)
+
+_META_FIELDS = frozenset(SourceMeta.__slots__)
+
+
+def _entry_key(provider: str, entry_id: str, scope: str | None) -> EntryKey:
+    """Build a canonical key for a new entry with interned low-cardinality parts."""
+    return (
+        sys.intern(provider),
+        entry_id,
+        None if scope is None else sys.intern(scope),
+    )
+
+
 class MetaStore:
-    """In-memory store for per-entry metadata."""
+    """In-memory store for per-entry metadata.
+
+    Entries are keyed by plain `(provider, entry_id, scope)` tuples built inline
+    at each call site; tuples of already-hashed strings are the cheapest key to
+    build and probe. Keys of new entries are canonicalized with interned
+    provider and scope strings so the store holds one copy of each.
+    """
 
     def __init__(self) -> None:
         """Initialize the metadata store."""
-        self._store: dict[tuple[str, str, str | None], SourceMeta] = {}
-
-    def _key(
-        self, provider: str, entry_id: str, scope: str | None
-    ) -> tuple[str, str, str | None]:
-        """Return a normalized key tuple for metadata lookups."""
-        return (provider, entry_id, scope)
+        self._store: dict[EntryKey, SourceMeta] = {}
 
     def get(
         self,
@@ -90,9 +114,11 @@ class MetaStore:
         Returns:
             SourceMeta: Mutable metadata instance for the entry.
         """
-        return self._store.setdefault(
-            self._key(provider, entry_id, scope), SourceMeta()
-        )
+        meta = self._store.get((provider, entry_id, scope))
+        if meta is None:
+            meta = SourceMeta()
+            self._store[_entry_key(provider, entry_id, scope)] = meta
+        return meta
 
     def peek(
         self,
@@ -110,7 +136,7 @@ class MetaStore:
         Returns:
             SourceMeta | None: Stored metadata or `None` when missing.
         """
-        return self._store.get(self._key(provider, entry_id, scope))
+        return self._store.get((provider, entry_id, scope))
 
     def set(
         self,
@@ -127,7 +153,7 @@ class MetaStore:
             meta (SourceMeta): Metadata object to store verbatim.
             scope (str | None): Optional season/scope identifier.
         """
-        self._store[self._key(provider, entry_id, scope)] = meta
+        self._store[_entry_key(provider, entry_id, scope)] = meta
 
     def update(
         self,
@@ -147,17 +173,29 @@ class MetaStore:
         Returns:
             SourceMeta: The updated metadata instance.
         """
-        meta = self.get(provider, entry_id, scope)
+        store = self._store
+        meta = store.get((provider, entry_id, scope))
+        if meta is None:
+            # Build new entries with their fields in a single constructor call
+            meta = SourceMeta(
+                **{
+                    field_name: field_value
+                    for field_name, field_value in values.items()
+                    if field_name in _META_FIELDS
+                }
+            )
+            store[_entry_key(provider, entry_id, scope)] = meta
+            return meta
         for field_name, field_value in values.items():
-            if hasattr(meta, field_name):
+            if field_name in _META_FIELDS:
                 setattr(meta, field_name, field_value)
         return meta
 
-    def items(self) -> list[tuple[tuple[str, str, str | None], SourceMeta]]:
+    def items(self) -> list[tuple[EntryKey, SourceMeta]]:
         """Return all stored metadata entries.
 
         Returns:
-            list[tuple[tuple[str, str, str | None], SourceMeta]]: Stored entries.
+            list[tuple[EntryKey, SourceMeta]]: Stored entries.
         """
         return list(self._store.items())
 
@@ -1,21 +1,29 @@
 """Provenance serialization helpers."""
 
 import importlib.metadata
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
-from anibridge_mappings.core.graph import EpisodeMappingGraph, ProvenanceEvent
+from anibridge_mappings.core.graph import EpisodeMappingGraph, IdNode, ProvenanceEvent
 
 
 def _normalize_timestamp(value: datetime | None) -> str:
     """Normalize a datetime to an ISO 8601 UTC string."""
     if value is None:
-        value = datetime.now(tz=UTC)
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=UTC)
+        return _now_iso(int(time.time()))
+    if value.tzinfo is None or value.tzinfo is UTC:
+        return value.replace(tzinfo=UTC).isoformat()
     return value.astimezone(UTC).isoformat()
 
 
+@lru_cache(maxsize=1)
+def _now_iso(second: int) -> str:
+    """Return the ISO 8601 UTC string for a Unix timestamp in whole seconds."""
+    return datetime.fromtimestamp(second, tz=UTC).isoformat()
+
+
 def _descriptor(provider: str, entry_id: str, scope: str | None) -> str:
     """Build a unique descriptor string for a given ID with optional scope."""
     if scope is None or scope == "":
@@ -23,23 +31,6 @@ def _descriptor(provider: str, entry_id: str, scope: str | None) -> str:
     return f"{provider}:{entry_id}:{scope}"
 
 
-def _event_payload(event: ProvenanceEvent) -> dict[str, Any]:
-    """Serialize a single provenance event into a JSON-ready payload."""
-    payload: dict[str, Any] = {
-        "seq": event.seq,
-        "action": event.action,
-        "stage": event.stage,
-        "effective": event.effective,
-    }
-    if event.actor is not None:
-        payload["actor"] = event.actor
-    if event.reason is not None:
-        payload["reason"] = event.reason
-    if event.details:
-        payload["details"] = event.details
-    return payload
-
-
 def _range_state(ranges: set[tuple[str, str]]) -> dict[str, Any]:
     """Build a range state payload from a set of source/target range pairs."""
     return {
@@ -53,11 +44,10 @@ def _index_value(value: str | None, index: dict[str, int], items: list[str]) ->
     """Get or assign an index for a given value in the provided index mapping."""
     if not value:
         return -1
-    if value in index:
-        return index[value]
-    idx = len(items)
-    items.append(value)
-    index[value] = idx
+    idx = index.get(value)
+    if idx is None:
+        idx = index[value] = len(items)
+        items.append(value)
     return idx
 
 
@@ -83,18 +73,22 @@ def build_provenance_payload(
         schema_version = importlib.metadata.version("anibridge-mappings")
     timestamp = _normalize_timestamp(generated_on)
 
-    mapping_events: dict[tuple[str, str], list[dict[str, Any]]] = {}
-    for source, target, events in episode_graph.provenance_items():
-        src_provider, src_id, src_scope, src_range = source
-        tgt_provider, tgt_id, tgt_scope, tgt_range = target
-        src_descriptor = _descriptor(src_provider, src_id, src_scope)
-        tgt_descriptor = _descriptor(tgt_provider, tgt_id, tgt_scope)
-        key = (src_descriptor, tgt_descriptor)
-        for event in events:
-            payload = _event_payload(event)
-            payload["source_range"] = src_range
-            payload["target_range"] = tgt_range
-            mapping_events.setdefault(key, []).append(payload)
+    groups = episode_graph.provenance_groups()
+    # Format each entry's descriptor once, sharing the string across groups
+    descriptor_of: dict[IdNode, str] = {
+        id_node: _descriptor(*id_node)
+        for id_node in {node for group in groups for node in group[:2]}
+    }
+    mapping_events: dict[tuple[str, str], list[tuple[ProvenanceEvent, str, str]]] = {}
+    for source, target, rows in groups:
+        key = (descriptor_of[source], descriptor_of[target])
+        existing = mapping_events.get(key)
+        if existing is None:
+            mapping_events[key] = rows
+        else:
+            # Entries whose scopes differ only by None vs "" share a descriptor
+            existing.extend(rows)
+            existing.sort(key=lambda row: row[0].seq)
 
     descriptors: list[str] = []
     descriptor_index: dict[str, int] = {}
@@ -106,50 +100,67 @@ def build_provenance_payload(
     actor_index: dict[str, int] = {}
     reasons: list[str] = []
     reason_index: dict[str, int] = {}
-    ranges: list[tuple[str, str]] = []
+    ranges: list[dict[str, str]] = []
     range_index: dict[tuple[str, str], int] = {}
+    label_indices: dict[
+        tuple[str, str, str | None, str | None], tuple[int, int, int, int]
+    ] = {}
 
     mappings: list[dict[str, Any]] = []
     present_count = 0
 
-    for (src_descriptor, tgt_descriptor), events in sorted(
-        mapping_events.items(), key=lambda item: (item[0][0], item[0][1])
-    ):
-        events.sort(key=lambda event: event["seq"])
+    # Keys are unique descriptor pairs, so sorting items never compares events
+    for (src_descriptor, tgt_descriptor), events in sorted(mapping_events.items()):
         src_idx = _index_value(src_descriptor, descriptor_index, descriptors)
         tgt_idx = _index_value(tgt_descriptor, descriptor_index, descriptors)
 
-        current_ranges: set[int] = set()
+        # Bitset of currently present ranges; bits are assigned per mapping so
+        # the mask stays small even when global range indices are large.
+        current_mask = 0
+        range_bits: dict[int, int] = {}
         compact_events: list[dict[str, Any]] = []
-        for event in events:
-            pair = (event["source_range"], event["target_range"])
-            if pair in range_index:
-                range_idx = range_index[pair]
-            else:
-                range_idx = len(ranges)
-                ranges.append(pair)
-                range_index[pair] = range_idx
-
-            if event.get("effective"):
-                if event.get("action") == "add":
-                    current_ranges.add(range_idx)
-                elif event.get("action") == "remove":
-                    current_ranges.discard(range_idx)
-
+        for event, source_range, target_range in events:
+            pair = (source_range, target_range)
+            range_idx = range_index.get(pair)
+            if range_idx is None:
+                range_idx = range_index[pair] = len(ranges)
+                ranges.append({"s": source_range, "t": target_range})
+
+            if event.effective:
+                bit = range_bits.get(range_idx)
+                if bit is None:
+                    bit = range_bits[range_idx] = 1 << len(range_bits)
+                if event.action == "add":
+                    current_mask |= bit
+                elif event.action == "remove":
+                    current_mask &= ~bit
+
+            # Events share a handful of action/stage/actor/reason combinations,
+            # so their pool indices are resolved once per combination.
+            labels = (event.action, event.stage, event.actor, event.reason)
+            label_idx = label_indices.get(labels)
+            if label_idx is None:
+                label_idx = label_indices[labels] = (
+                    _index_value(event.action, action_index, actions),
+                    _index_value(event.stage, stage_index, stages),
+                    _index_value(event.actor, actor_index, actors),
+                    _index_value(event.reason, reason_index, reasons),
+                )
+            action_idx, stage_idx, actor_idx, reason_idx = label_idx
             compact_event: dict[str, Any] = {
-                "seq": event["seq"],
-                "a": _index_value(str(event.get("action")), action_index, actions),
-                "s": _index_value(str(event.get("stage")), stage_index, stages),
-                "e": 1 if event.get("effective") else 0,
+                "seq": event.seq,
+                "a": action_idx,
+                "s": stage_idx,
+                "e": 1 if event.effective else 0,
                 "r": range_idx,
-                "ac": _index_value(event.get("actor"), actor_index, actors),
-                "rs": _index_value(event.get("reason"), reason_index, reasons),
+                "ac": actor_idx,
+                "rs": reason_idx,
             }
-            if include_details and event.get("details"):
-                compact_event["d"] = event.get("details")
+            if include_details and event.details:
+                compact_event["d"] = event.details
             compact_events.append(compact_event)
 
-        present = len(current_ranges) > 0
+        present = current_mask != 0
         if present:
             present_count += 1
 
@@ -175,7 +186,7 @@ def build_provenance_payload(
             "stages": stages,
             "actors": actors,
             "reasons": reasons,
-            "ranges": [{"s": src, "t": tgt} for src, tgt in ranges],
+            "ranges": ranges,
         },
         "mappings": mappings,
     }
@@ -1,5 +1,7 @@
 """Stats building for the aggregation pipeline."""
 
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Any
 
 from anibridge_mappings.core.aggregator import AggregationArtifacts
@@ -9,9 +11,64 @@ from anibridge_mappings.utils.mapping import parse_descriptor
 
 def _count_edges(graph: _BaseGraph) -> int:
     """Return edge counts derived from graph adjacency."""
-    nodes = graph.nodes()
-    link_count = sum(len(graph.neighbors(node)) for node in nodes)
-    return link_count
+    return graph.link_count()
+
+
+@dataclass(slots=True)
+class _ProviderTally:
+    """Per-provider counters accumulated while scanning the mappings payload."""
+
+    descriptors: set[tuple[str, str | None]] = field(default_factory=set)
+    ids: set[str] = field(default_factory=set)
+    scopes: set[str | None] = field(default_factory=set)
+    source_descriptors: int = 0
+    target_descriptors: int = 0
+    source_range_units: int = 0
+    target_range_units: int = 0
+
+    def add_descriptor(self, entry_id: str, scope: str | None) -> None:
+        """Record a parsed descriptor belonging to this provider."""
+        self.descriptors.add((entry_id, scope))
+        self.ids.add(entry_id)
+        self.scopes.add(scope)
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize the counters into the provider stats payload."""
+        return {
+            "distinct_descriptors": len(self.descriptors),
+            "distinct_ids": len(self.ids),
+            "distinct_scopes": len(self.scopes),
+            "source_descriptors": self.source_descriptors,
+            "target_descriptors": self.target_descriptors,
+            "descriptors": self.source_descriptors + self.target_descriptors,
+            "source_range_units": self.source_range_units,
+            "target_range_units": self.target_range_units,
+        }
+
+
+def _lookup_descriptor(
+    descriptor: str, parsed: dict[str, tuple[str, str, str | None] | None]
+) -> tuple[str, str, str | None] | None:
+    """Parse a descriptor once per stats run, caching failures as `None`."""
+    try:
+        return parsed[descriptor]
+    except KeyError:
+        pass
+    try:
+        result: tuple[str, str, str | None] | None = parse_descriptor(descriptor)
+    except ValueError:
+        result = None
+    parsed[descriptor] = result
+    return result
+
+
+def _count_segments(target_spec: object) -> int:
+    """Return the number of non-blank comma-separated segments in a range spec."""
+    spec = target_spec if isinstance(target_spec, str) else str(target_spec)
+    if "," not in spec:
+        # Most specs are a single range, so skip the split entirely
+        return 1 if spec and not spec.isspace() else 0
+    return sum(1 for seg in spec.split(",") if seg and not seg.isspace())
 
 
 def _compact_count(value: int) -> str:
@@ -51,17 +108,8 @@ def build_stats(
     meta_store = artifacts.meta_store
     issues = artifacts.validation_issues
 
-    provider_stats: dict[str, dict[str, int]] = {}
-    descriptor_sets: dict[str, set[tuple[str, str | None]]] = {}
-    id_sets: dict[str, set[str]] = {}
-    scope_sets: dict[str, set[str | None]] = {}
-    source_descriptor_sets: dict[str, set[str]] = {}
-    target_descriptor_sets: dict[str, set[str]] = {}
-    source_descriptor_counts: dict[str, int] = {}
-    target_descriptor_counts: dict[str, int] = {}
-    source_range_counts: dict[str, int] = {}
-    target_range_counts: dict[str, int] = {}
-
+    parsed: dict[str, tuple[str, str, str | None] | None] = {}
+    tallies: defaultdict[str, _ProviderTally] = defaultdict(_ProviderTally)
     source_descriptors_total = 0
     target_descriptors_total = 0
     source_ranges_total = 0
@@ -72,100 +120,56 @@ def build_stats(
         if source_descriptor == "$meta":
             continue
         descriptor_union.add(source_descriptor)
-        try:
-            src_provider, src_id, src_scope = parse_descriptor(source_descriptor)
-        except ValueError:
+        src_parsed = _lookup_descriptor(source_descriptor, parsed)
+        if src_parsed is None:
             continue
-        descriptor_sets.setdefault(src_provider, set()).add((src_id, src_scope))
-        id_sets.setdefault(src_provider, set()).add(src_id)
-        scope_sets.setdefault(src_provider, set()).add(src_scope)
-        source_descriptor_sets.setdefault(src_provider, set()).add(source_descriptor)
-        source_descriptor_counts[src_provider] = (
-            source_descriptor_counts.get(src_provider, 0) + 1
-        )
+        src_provider, src_id, src_scope = src_parsed
+        src_tally = tallies[src_provider]
+        src_tally.add_descriptor(src_id, src_scope)
+        src_tally.source_descriptors += 1
         source_descriptors_total += 1
 
         for target_descriptor, range_map in targets.items():
             descriptor_union.add(target_descriptor)
-            try:
-                tgt_provider, tgt_id, tgt_scope = parse_descriptor(target_descriptor)
-            except ValueError:
+            tgt_parsed = _lookup_descriptor(target_descriptor, parsed)
+            if tgt_parsed is None:
                 continue
-            descriptor_sets.setdefault(tgt_provider, set()).add((tgt_id, tgt_scope))
-            id_sets.setdefault(tgt_provider, set()).add(tgt_id)
-            scope_sets.setdefault(tgt_provider, set()).add(tgt_scope)
-            target_descriptor_sets.setdefault(tgt_provider, set()).add(
-                target_descriptor
-            )
-            target_descriptor_counts[tgt_provider] = (
-                target_descriptor_counts.get(tgt_provider, 0) + 1
-            )
+            tgt_provider, tgt_id, tgt_scope = tgt_parsed
+            tgt_tally = tallies[tgt_provider]
+            tgt_tally.add_descriptor(tgt_id, tgt_scope)
+            tgt_tally.target_descriptors += 1
             target_descriptors_total += 1
 
             source_range_units = len(range_map)
-            source_range_counts[src_provider] = (
-                source_range_counts.get(src_provider, 0) + source_range_units
-            )
+            src_tally.source_range_units += source_range_units
             source_ranges_total += source_range_units
 
-            for target_spec in range_map.values():
-                segments = [
-                    seg.strip() for seg in str(target_spec).split(",") if seg.strip()
-                ]
-                target_range_counts[tgt_provider] = target_range_counts.get(
-                    tgt_provider, 0
-                ) + len(segments)
-                target_ranges_total += len(segments)
-
-    for provider in set(
-        list(descriptor_sets)
-        + list(id_sets)
-        + list(scope_sets)
-        + list(source_descriptor_counts)
-        + list(target_descriptor_counts)
-        + list(source_range_counts)
-        + list(target_range_counts)
-        + list(source_descriptor_sets)
-        + list(target_descriptor_sets)
-    ):
-        stats = provider_stats.setdefault(provider, {})
-        stats["distinct_descriptors"] = len(descriptor_sets.get(provider, set()))
-        stats["distinct_ids"] = len(id_sets.get(provider, set()))
-        stats["distinct_scopes"] = len(scope_sets.get(provider, set()))
-        stats["source_descriptors"] = source_descriptor_counts.get(provider, 0)
-        stats["target_descriptors"] = target_descriptor_counts.get(provider, 0)
-        stats["descriptors"] = stats["source_descriptors"] + stats["target_descriptors"]
-        stats["source_range_units"] = source_range_counts.get(provider, 0)
-        stats["target_range_units"] = target_range_counts.get(provider, 0)
-
-    validator_counts: dict[str, int] = {}
-    source_provider_counts: dict[str, int] = {}
-    target_provider_counts: dict[str, int] = {}
+            target_range_units = sum(map(_count_segments, range_map.values()))
+            tgt_tally.target_range_units += target_range_units
+            target_ranges_total += target_range_units
+
+    provider_stats = {provider: tally.to_dict() for provider, tally in tallies.items()}
+
+    validator_counts: defaultdict[str, int] = defaultdict(int)
+    source_provider_counts: defaultdict[str, int] = defaultdict(int)
+    target_provider_counts: defaultdict[str, int] = defaultdict(int)
     distinct_sources: set[str] = set()
     distinct_targets: set[str] = set()
 
     for issue in issues:
-        validator_counts[issue.validator] = validator_counts.get(issue.validator, 0) + 1
+        validator_counts[issue.validator] += 1
         if issue.source:
             distinct_sources.add(issue.source)
-            try:
-                src_provider, _src_id, _src_scope = parse_descriptor(issue.source)
-            except ValueError:
-                src_provider = None
+            src_parsed = _lookup_descriptor(issue.source, parsed)
+            src_provider = src_parsed[0] if src_parsed else None
             if src_provider:
-                source_provider_counts[src_provider] = (
-                    source_provider_counts.get(src_provider, 0) + 1
-                )
+                source_provider_counts[src_provider] += 1
         if issue.target:
             distinct_targets.add(issue.target)
-            try:
-                tgt_provider, _tgt_id, _tgt_scope = parse_descriptor(issue.target)
-            except ValueError:
-                tgt_provider = None
+            tgt_parsed = _lookup_descriptor(issue.target, parsed)
+            tgt_provider = tgt_parsed[0] if tgt_parsed else None
             if tgt_provider:
-                target_provider_counts[tgt_provider] = (
-                    target_provider_counts.get(tgt_provider, 0) + 1
-                )
+                target_provider_counts[tgt_provider] += 1
 
     summary = {
         "providers": len(provider_stats),
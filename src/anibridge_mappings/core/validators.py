@@ -1,19 +1,30 @@
 """Validation helpers for mapping integrity checks."""
 
-from collections.abc import Iterable
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Any, cast
+from functools import cache
+from operator import itemgetter
+from typing import Any
 
 from anibridge_mappings.core.graph import EpisodeMappingGraph, IdMappingGraph
 from anibridge_mappings.core.meta import MetaStore
 from anibridge_mappings.utils.mapping import (
+    SourceNode,
     SourceTargetMap,
+    TargetNode,
     build_source_target_map,
     parse_range_bounds,
     provider_scope_sort_key,
     split_ratio,
 )
 
+# Stand-in for open-ended range ends. Keeping it an int (rather than
+# float("inf")) keeps sort keys and overlap checks on int-only comparisons;
+# no real episode number comes anywhere near it.
+_END_SENTINEL = sys.maxsize
+
 
 @dataclass(slots=True)
 class ValidationIssue:
@@ -34,12 +45,19 @@ class ValidationContext:
 
     This caches the computed source-target map so that validators
     can iterate the same derived structures without recomputing them.
+    `range_pairs` mirrors `source_map` with each target's range pairs
+    flattened, sorted and paired with their parsed source spec once up
+    front, and `range_specs` holds the spec of every distinct source range.
+    `descriptors` maps every source and target node to its descriptor.
     """
 
     episode_graph: EpisodeMappingGraph
     meta_store: MetaStore
     id_graph: IdMappingGraph
     source_map: SourceTargetMap
+    range_pairs: RangePairMap
+    range_specs: dict[str, RangeSpec]
+    descriptors: dict[SourceNode, str]
 
     @classmethod
     def from_graphs(
@@ -49,11 +67,37 @@ class ValidationContext:
         id_graph: IdMappingGraph,
     ) -> ValidationContext:
         """Construct a validation context with a cached source map."""
+        source_map = build_source_target_map(episode_graph)
+        range_specs = {
+            source_range: _parse_range_spec(source_range)
+            for targets in source_map.values()
+            for source_ranges in targets.values()
+            for source_range in source_ranges
+        }
+        descriptors: dict[SourceNode, str] = {}
+        for source, targets in source_map.items():
+            for node in (source, *targets):
+                if node not in descriptors:
+                    descriptors[node] = _descriptor(*node)
         return cls(
             episode_graph=episode_graph,
             meta_store=meta_store,
             id_graph=id_graph,
-            source_map=build_source_target_map(episode_graph),
+            source_map=source_map,
+            range_pairs={
+                source: {
+                    target: tuple(
+                        (source_range, range_specs[source_range], target_range)
+                        for source_range, target_range in _iter_target_ranges(
+                            source_ranges
+                        )
+                    )
+                    for target, source_ranges in targets.items()
+                }
+                for source, targets in source_map.items()
+            },
+            range_specs=range_specs,
+            descriptors=descriptors,
         )
 
 
@@ -95,7 +139,7 @@ class MappingValidator:
         )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RangeSpec:
     """Parsed range specification data."""
 
@@ -110,7 +154,7 @@ class RangeSpec:
         return self.base is not None and self.bounds is not None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SegmentBounds:
     """Parsed segment bounds with metadata."""
 
@@ -120,6 +164,12 @@ class SegmentBounds:
     raw: str
 
 
+# (source_range, parsed source spec, target_range) entries per source and target
+RangePairMap = dict[
+    SourceNode, dict[TargetNode, tuple[tuple[str, RangeSpec, str], ...]]
+]
+
+
 def _descriptor(provider: str, entry_id: str, scope: str | None) -> str:
     """Build a provider descriptor string from components."""
     if scope is None:
@@ -137,18 +187,6 @@ def _iter_target_ranges(
             yield source_range, target_range
 
 
-def _range_length_and_ratio(range_key: str) -> tuple[int, int | None] | None:
-    """Return (length, ratio) for a simple numeric range key, if possible."""
-    if not range_key or "," in range_key:
-        return None
-    spec = _parse_range_spec(range_key)
-    if not spec.is_valid or spec.bounds is None or spec.bounds[1] is None:
-        return None
-    start, end_opt = spec.bounds
-    end = cast(int, end_opt)
-    return (end - start + 1, spec.ratio)
-
-
 def _iter_target_segment_strings(target_range: str) -> Iterable[str]:
     """Yield individual target range segments (comma-separated)."""
     for segment in target_range.split(","):
@@ -157,6 +195,7 @@ def _iter_target_segment_strings(target_range: str) -> Iterable[str]:
             yield segment
 
 
+@cache
 def _parse_range_spec(range_key: str) -> RangeSpec:
     """Parse a range key into its base, ratio, and bounds."""
     split = split_ratio(range_key)
@@ -167,46 +206,194 @@ def _parse_range_spec(range_key: str) -> RangeSpec:
     return RangeSpec(raw=range_key, base=base, ratio=ratio, bounds=bounds)
 
 
-def _ranges_overlap(
-    start_a: int,
-    end_a: int | None,
-    start_b: int,
-    end_b: int | None,
-) -> bool:
-    """Return True if two inclusive ranges overlap (supports open-ended)."""
-    return not (
-        (end_a is not None and end_a < start_b)
-        or (end_b is not None and end_b < start_a)
-    )
-
+@cache
+def _segment_bounds(target_range: str) -> tuple[tuple[str, SegmentBounds | None], ...]:
+    """Return each target range segment with its parsed bounds.
 
-def _iter_segment_bounds(target_range: str) -> Iterable[SegmentBounds]:
-    """Yield parsed bounds for each target range segment."""
+    Segments with invalid syntax are paired with `None` bounds.
+    """
+    segments: list[tuple[str, SegmentBounds | None]] = []
     for segment in _iter_target_segment_strings(target_range):
         spec = _parse_range_spec(segment)
         if not spec.is_valid or spec.bounds is None:
+            segments.append((segment, None))
             continue
         start, end = spec.bounds
-        yield SegmentBounds(
-            start=start,
-            end=end,
-            ratio=spec.ratio,
-            raw=segment,
+        segments.append(
+            (
+                segment,
+                SegmentBounds(
+                    start=start,
+                    end=end,
+                    ratio=spec.ratio,
+                    raw=segment,
+                ),
+            )
         )
+    return tuple(segments)
 
 
 def _segment_source_units(segment: SegmentBounds) -> int | None:
     """Return source units represented by a target segment, if determinable."""
-    if segment.end is None:
+    end, ratio = segment.end, segment.ratio
+    if end is None:
         return None
-    length = segment.end - segment.start + 1
-    if segment.ratio is None:
+    length = end - segment.start + 1
+    if ratio is None:
         return length
-    if segment.ratio > 0:
-        if length % segment.ratio != 0:
+    if ratio < 0:
+        return length * -ratio
+    units, remainder = divmod(length, ratio)
+    return None if remainder else units
+
+
+@cache
+def _sorted_segments(target_range: str) -> tuple[tuple[int, int, str], ...]:
+    """Return (start, end, raw) for valid target segments in bounds order."""
+    return tuple(
+        sorted(
+            (
+                (
+                    segment.start,
+                    _END_SENTINEL if segment.end is None else segment.end,
+                    segment.raw,
+                )
+                for _, segment in _segment_bounds(target_range)
+                if segment is not None
+            ),
+            key=itemgetter(0, 1),
+        )
+    )
+
+
+@cache
+def _target_segment_overlaps(target_range: str) -> tuple[tuple[str, str], ...]:
+    """Return (overlaps_with, segment) pairs of overlapping target segments."""
+    ordered = _sorted_segments(target_range)
+    if len(ordered) <= 1:
+        return ()
+    overlaps: list[tuple[str, str]] = []
+    _, prev_end, prev_raw = ordered[0]
+    for start, end, raw in ordered[1:]:
+        if start <= prev_end:
+            overlaps.append((prev_raw, raw))
+        if end > prev_end:
+            prev_end, prev_raw = end, raw
+    return tuple(overlaps)
+
+
+@cache
+def _target_source_units(target_range: str) -> int | None:
+    """Return total source units covered by a target range, if determinable."""
+    total = 0
+    found = False
+    for _, segment in _segment_bounds(target_range):
+        if segment is None:
+            continue
+        units = _segment_source_units(segment)
+        if units is None:
             return None
-        return length // segment.ratio
-    return length * abs(segment.ratio)
+        total += units
+        found = True
+    return total if found else None
+
+
+def _check_target_range(
+    name: str,
+    emit: Callable[[ValidationIssue], None],
+    source_descriptor: str,
+    target_descriptor: str,
+    source_range: str,
+    target_range: str,
+    src_units: int | None,
+    limit: int,
+    target_segments: list[tuple[int, int, str, str]],
+) -> None:
+    """Check the target side of a single mapping.
+
+    Issues are passed to `emit` and valid segments are appended to
+    `target_segments` for the cross-mapping overlap check.
+    """
+    # Appending each mapping as a sorted run lets the final sort merge runs
+    target_segments.extend(
+        (start, end, source_range, target_range)
+        for start, end, _ in _sorted_segments(target_range)
+    )
+    segment_bounds = _segment_bounds(target_range)
+
+    if limit > 0:
+        for _, segment in segment_bounds:
+            if segment is None:
+                continue
+            # Open-ended segments only need their start within limit
+            last_episode = segment.start if segment.end is None else segment.end
+            if last_episode <= limit:
+                continue
+            emit(
+                ValidationIssue(
+                    name,
+                    "Target mapping exceeds available episodes",
+                    source_descriptor,
+                    target_descriptor,
+                    source_range,
+                    segment.raw,
+                    {
+                        "source_range": source_range,
+                        "target_range": segment.raw,
+                        "episode_limit": limit,
+                    },
+                )
+            )
+
+    for raw_segment, segment in segment_bounds:
+        if segment is not None:
+            continue
+        emit(
+            ValidationIssue(
+                name,
+                "Invalid target range syntax",
+                source_descriptor,
+                target_descriptor,
+                source_range,
+                raw_segment,
+                {"target_range": raw_segment},
+            )
+        )
+
+    for overlaps_with, raw_segment in _target_segment_overlaps(target_range):
+        emit(
+            ValidationIssue(
+                name,
+                "Overlapping target segments within a mapping",
+                source_descriptor,
+                target_descriptor,
+                source_range,
+                target_range,
+                {
+                    "overlaps_with": overlaps_with,
+                    "segment": raw_segment,
+                },
+            )
+        )
+
+    if src_units is None:
+        return
+    total_units = _target_source_units(target_range)
+    if total_units is not None and total_units != src_units:
+        emit(
+            ValidationIssue(
+                name,
+                "Target segments expand beyond source range units",
+                source_descriptor,
+                target_descriptor,
+                source_range,
+                target_range,
+                {
+                    "source_units": src_units,
+                    "target_units": total_units,
+                },
+            )
+        )
 
 
 class MappingRangeValidator(MappingValidator):
@@ -223,280 +410,136 @@ class MappingRangeValidator(MappingValidator):
         Returns:
             list[ValidationIssue]: Range validation issues found.
         """
+        name = self.name
         issues: list[ValidationIssue] = []
-
-        for (src_provider, src_id, src_scope), targets in context.source_map.items():
-            source_descriptor = _descriptor(src_provider, src_id, src_scope)
-            provider_source_ranges: dict[
-                str, list[tuple[int, int | None, str, str, str]]
-            ] = {}
-            for (t_provider, t_id, t_scope), source_ranges in targets.items():
-                target_descriptor = _descriptor(t_provider, t_id, t_scope)
+        emit = issues.append
+        descriptors = context.descriptors
+
+        for source, targets in context.range_pairs.items():
+            source_descriptor = descriptors[source]
+            provider_source_ranges: defaultdict[
+                str, list[tuple[int, int, Any, str, str, str]]
+            ] = defaultdict(list)
+            for target, range_pairs in targets.items():
+                target_descriptor = descriptors[target]
+                t_provider, t_id, t_scope = target
                 meta = context.meta_store.peek(t_provider, t_id, t_scope)
-                limit = meta.episodes if meta else None
-                target_segments: list[tuple[int, int | None, str, str]] = []
-
-                for source_range, target_range in _iter_target_ranges(source_ranges):
-                    source_spec = _parse_range_spec(source_range)
-                    if "," in source_range:
-                        issues.append(
-                            self.issue(
-                                "Source ranges must be contiguous (no commas)",
-                                source=source_descriptor,
-                                target=target_descriptor,
-                                source_range=source_range,
-                                target_range=target_range,
-                                details={"source_range": source_range},
-                            )
-                        )
-                    if not source_spec.is_valid:
-                        issues.append(
-                            self.issue(
-                                "Invalid source range syntax",
-                                source=source_descriptor,
-                                target=target_descriptor,
-                                source_range=source_range,
-                                target_range=target_range,
-                                details={"source_range": source_range},
-                            )
-                        )
-                    elif source_spec.bounds is not None:
+                limit = (meta.episodes or 0) if meta else 0
+                target_segments: list[tuple[int, int, str, str]] = []
+
+                for source_range, source_spec, target_range in range_pairs:
+                    src_units: int | None = None
+                    # Bounds only parse from a valid base, so they imply validity
+                    if source_spec.bounds is not None:
                         source_start, source_end = source_spec.bounds
-                        provider_source_ranges.setdefault(t_provider, []).append(
+                        provider_source_ranges[t_provider].append(
                             (
                                 source_start,
-                                source_end,
+                                _END_SENTINEL if source_end is None else source_end,
+                                provider_scope_sort_key(target_descriptor),
                                 target_descriptor,
                                 source_range,
                                 target_range,
                             )
                         )
-
-                    src_info = _range_length_and_ratio(source_range)
-                    src_len: int | None = None
-                    src_ratio: int | None = None
-                    if src_info is not None:
-                        src_len, src_ratio = src_info
-
-                    segments = list(_iter_segment_bounds(target_range))
-                    for segment in segments:
-                        target_segments.append(
-                            (
-                                segment.start,
-                                segment.end,
+                        # Only closed, unscaled source ranges have a unit count
+                        if source_end is not None and source_spec.ratio is None:
+                            src_units = source_end - source_start + 1
+                    else:
+                        # Commas never parse, so only invalid ranges need the scan
+                        source_details = {"source_range": source_range}
+                        if "," in source_range:
+                            emit(
+                                ValidationIssue(
+                                    name,
+                                    "Source ranges must be contiguous (no commas)",
+                                    source_descriptor,
+                                    target_descriptor,
+                                    source_range,
+                                    target_range,
+                                    source_details,
+                                )
+                            )
+                        emit(
+                            ValidationIssue(
+                                name,
+                                "Invalid source range syntax",
+                                source_descriptor,
+                                target_descriptor,
                                 source_range,
                                 target_range,
+                                source_details,
                             )
                         )
 
-                        if limit and limit > 0:
-                            if segment.end is None:
-                                if segment.start > limit:
-                                    issues.append(
-                                        self.issue(
-                                            "Target mapping exceeds available episodes",
-                                            source=source_descriptor,
-                                            target=target_descriptor,
-                                            source_range=source_range,
-                                            target_range=segment.raw,
-                                            details={
-                                                "source_range": source_range,
-                                                "target_range": segment.raw,
-                                                "episode_limit": limit,
-                                            },
-                                        )
-                                    )
-                            elif segment.end > limit:
-                                issues.append(
-                                    self.issue(
-                                        "Target mapping exceeds available episodes",
-                                        source=source_descriptor,
-                                        target=target_descriptor,
-                                        source_range=source_range,
-                                        target_range=segment.raw,
-                                        details={
-                                            "source_range": source_range,
-                                            "target_range": segment.raw,
-                                            "episode_limit": limit,
-                                        },
-                                    )
-                                )
-
-                    for segment in _iter_target_segment_strings(target_range):
-                        target_spec = _parse_range_spec(segment)
-                        if target_spec.is_valid:
-                            continue
-                        issues.append(
-                            self.issue(
-                                "Invalid target range syntax",
-                                source=source_descriptor,
-                                target=target_descriptor,
-                                source_range=source_range,
-                                target_range=segment,
-                                details={"target_range": segment},
-                            )
-                        )
+                    _check_target_range(
+                        name,
+                        emit,
+                        source_descriptor,
+                        target_descriptor,
+                        source_range,
+                        target_range,
+                        src_units,
+                        limit,
+                        target_segments,
+                    )
 
-                    if len(segments) > 1:
-                        segments.sort(
-                            key=lambda item: (
-                                item.start,
-                                float("inf") if item.end is None else item.end,
-                            )
-                        )
-                        prev = segments[0]
-                        for current in segments[1:]:
-                            if _ranges_overlap(
-                                prev.start,
-                                prev.end,
-                                current.start,
-                                current.end,
-                            ):
-                                issues.append(
-                                    self.issue(
-                                        "Overlapping target segments within a mapping",
-                                        source=source_descriptor,
-                                        target=target_descriptor,
-                                        source_range=source_range,
-                                        target_range=target_range,
-                                        details={
-                                            "overlaps_with": prev.raw,
-                                            "segment": current.raw,
-                                        },
-                                    )
+                # Segments can only conflict across different source ranges, and
+                # range pairs are sorted by source range.
+                if len(target_segments) > 1 and range_pairs[0][0] != range_pairs[-1][0]:
+                    target_segments.sort(key=itemgetter(0, 1))
+                    # Sweep in start order against the segment reaching furthest
+                    segment_iter = iter(target_segments)
+                    _, prev_end, prev_src, prev_base = next(segment_iter)
+                    for start, end, src_range, tgt_range in segment_iter:
+                        if start <= prev_end and src_range != prev_src:
+                            emit(
+                                ValidationIssue(
+                                    name,
+                                    "Overlapping target episode ranges for the "
+                                    "same target scope",
+                                    source_descriptor,
+                                    target_descriptor,
+                                    src_range,
+                                    tgt_range,
+                                    {
+                                        "source_range": src_range,
+                                        "target_range": tgt_range,
+                                        "overlaps_with_source_range": prev_src,
+                                        "overlaps_with_target_range": prev_base,
+                                    },
                                 )
-                            prev_end_value = (
-                                float("inf") if prev.end is None else prev.end
-                            )
-                            current_end_value = (
-                                float("inf") if current.end is None else current.end
-                            )
-                            if current_end_value > prev_end_value:
-                                prev = current
-
-                    if src_len is None or src_ratio is not None:
-                        continue
-                    if not segments:
-                        continue
-
-                    segment_units: list[int] = []
-                    units_unknown = False
-                    for segment in segments:
-                        units = _segment_source_units(segment)
-                        if units is None:
-                            units_unknown = True
-                            break
-                        segment_units.append(units)
-
-                    if units_unknown or not segment_units:
-                        continue
-
-                    total_units = sum(segment_units)
-                    if total_units != src_len:
-                        issues.append(
-                            self.issue(
-                                "Target segments expand beyond source range units",
-                                source=source_descriptor,
-                                target=target_descriptor,
-                                source_range=source_range,
-                                target_range=target_range,
-                                details={
-                                    "source_units": src_len,
-                                    "target_units": total_units,
-                                },
                             )
-                        )
-
-                if len(target_segments) > 1:
-                    target_segments.sort(
-                        key=lambda item: (
-                            item[0],
-                            float("inf") if item[1] is None else item[1],
-                        )
-                    )
-                    prev: tuple[int, int | None, str, str] | None = None
-                    for start, end, src_range, tgt_range in target_segments:
-                        if prev is not None:
-                            prev_start, prev_end, prev_src, prev_base = prev
-                            if src_range != prev_src and _ranges_overlap(
-                                start, end, prev_start, prev_end
-                            ):
-                                issues.append(
-                                    self.issue(
-                                        "Overlapping target episode ranges for the "
-                                        "same target scope",
-                                        source=source_descriptor,
-                                        target=target_descriptor,
-                                        source_range=src_range,
-                                        target_range=tgt_range,
-                                        details={
-                                            "source_range": src_range,
-                                            "target_range": tgt_range,
-                                            "overlaps_with_source_range": prev_src,
-                                            "overlaps_with_target_range": prev_base,
-                                        },
-                                    )
-                                )
-                        prev_end_value = (
-                            float("inf")
-                            if prev is None
-                            else (float("inf") if prev[1] is None else prev[1])
-                        )
-                        current_end_value = float("inf") if end is None else end
-                        if prev is None or current_end_value >= prev_end_value:
-                            prev = (start, end, src_range, tgt_range)
+                        if end >= prev_end:
+                            prev_end, prev_src, prev_base = end, src_range, tgt_range
 
             for target_provider, items in provider_source_ranges.items():
                 if len(items) <= 1:
                     continue
-                items.sort(
-                    key=lambda item: (
-                        item[0],
-                        10**9 if item[1] is None else item[1],
-                        provider_scope_sort_key(item[2]),
-                        item[3],
-                        item[4],
-                    )
-                )
-                accepted: list[tuple[int, int | None, str, str, str]] = []
-                for start, end, target_descriptor, source_range, target_range in items:
-                    overlap_with = next(
-                        (
-                            accepted_item
-                            for accepted_item in accepted
-                            if _ranges_overlap(
-                                start,
-                                end,
-                                accepted_item[0],
-                                accepted_item[1],
-                            )
-                        ),
-                        None,
-                    )
-                    if overlap_with is None:
-                        accepted.append(
-                            (
-                                start,
-                                end,
-                                target_descriptor,
-                                source_range,
-                                target_range,
-                            )
-                        )
+                items.sort(key=itemgetter(0, 1, 2, 4, 5))
+                # Accepted ranges are disjoint and sorted by start, so only the
+                # most recently accepted one can overlap the next item.
+                item_iter = iter(items)
+                accepted = next(item_iter)
+                for item in item_iter:
+                    start, _, _, target_descriptor, source_range, target_range = item
+                    if start > accepted[1]:
+                        accepted = item
                         continue
 
-                    _, _, prev_target, prev_source_range, prev_target_range = (
-                        overlap_with
+                    _, _, _, prev_target, prev_source_range, prev_target_range = (
+                        accepted
                     )
-                    issues.append(
-                        self.issue(
+                    emit(
+                        ValidationIssue(
+                            name,
                             "Overlapping source episode ranges for the same target "
                             "provider",
-                            source=source_descriptor,
-                            target=target_descriptor,
-                            source_range=source_range,
-                            target_range=target_range,
-                            details={
+                            source_descriptor,
+                            target_descriptor,
+                            source_range,
+                            target_range,
+                            {
                                 "target_provider": target_provider,
                                 "overlaps_with_target": prev_target,
                                 "overlaps_with_source_range": prev_source_range,
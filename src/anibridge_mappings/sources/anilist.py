@@ -1,6 +1,7 @@
 """Metadata provider that fetches AniList episode counts."""
 
 import asyncio
+import re
 from logging import getLogger
 from typing import Any
 
@@ -8,27 +9,41 @@ import aiohttp
 
 from anibridge_mappings.core.meta import SourceMeta, SourceType
 from anibridge_mappings.sources.base import CachedMetadataSource
+from anibridge_mappings.utils.serialization import dumps, loads
 
 log = getLogger(__name__)
 
+# Messages AniList uses when a query exceeds its cost/complexity budget
+_COST_ERROR_PATTERN = re.compile(
+    r"max(?:imum)? query complexity|query cost limit", re.IGNORECASE
+)
+
 
 class AnilistSource(CachedMetadataSource):
     """Collect AniList episode counts via batched GraphQL queries."""
 
     API_URL = "https://graphql.anilist.co"
     BATCH_SIZE = 50
+    PAGES_PER_REQUEST = 70
 
     provider_key = "anilist"
     cache_filename = "anilist_meta.json"
 
-    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+    def __init__(
+        self,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = 4,
+    ) -> None:
         """Initialize the AnilistSource.
 
         Args:
             batch_size (int): Maximum IDs per AniList page query.
+            concurrency (int): Maximum concurrent GraphQL requests.
         """
-        super().__init__(concurrency=1)
+        super().__init__(concurrency=concurrency)
         self._batch_size = max(1, batch_size)
+        # Lowered whenever AniList rejects a request as too costly
+        self._learned_pages_per_request = self.PAGES_PER_REQUEST
 
     def _session_kwargs(self) -> dict[str, Any]:
         """Return aiohttp session settings for AniList requests."""
@@ -36,7 +51,8 @@ class AnilistSource(CachedMetadataSource):
             "headers": {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
-            }
+            },
+            "json_serialize": lambda obj: dumps(obj).decode(),
         }
 
     async def _fetch_missing(
@@ -58,111 +74,199 @@ class AnilistSource(CachedMetadataSource):
 
         # How many `Page` aliases to pack into a single HTTP request.
         # Each alias corresponds to one simple batch.
-        pages_per_request = 70
-
-        results: list[tuple[str, dict[str | None, SourceMeta] | None, bool]] = []
+        pages_per_request = self._learned_pages_per_request
+        jobs = [
+            simple_batches[start : start + pages_per_request]
+            for start in range(0, len(simple_batches), pages_per_request)
+        ]
 
-        async with aiohttp.ClientSession(**self._session_kwargs()) as session:
-            # Process groups of simple_batches per HTTP request.
-            for start in range(0, len(simple_batches), pages_per_request):
-                multi_batches = simple_batches[start : start + pages_per_request]
-
-                # Build variable definitions and values.
-                var_defs = ["$perPage: Int!"]
-                variables: dict[str, Any] = {"perPage": self._batch_size}
-                query_sections: list[str] = []
-
-                # For each batch of IDs, create an aliased Page block.
-                for idx, batch in enumerate(multi_batches):
-                    alias = f"batch{idx + 1}"
-                    ids_var = f"ids_{idx + 1}"
-
-                    var_defs.append(f"${ids_var}: [Int!]!")
-                    variables[ids_var] = [int(eid) for eid in batch]
-
-                    query_sections.append(
-                        f"""
-                        {alias}: Page(page: 1, perPage: $perPage) {{
-                            media(id_in: ${ids_var}, type: ANIME) {{
-                                id
-                                episodes
-                                format
-                                seasonYear
-                                duration
-                            }}
-                        }}
-                        """
-                    )
-
-                query = f"""
-                query ({", ".join(var_defs)}) {{
-                    {" ".join(query_sections)}
+        semaphore = asyncio.Semaphore(self._concurrency)
+        session = await self._get_session()
+        job_results = await asyncio.gather(
+            *(
+                self._fetch_batches(session, semaphore, multi_batches)
+                for multi_batches in jobs
+            )
+        )
+
+        return [result for batch_results in job_results for result in batch_results]
+
+    def _build_payload(self, multi_batches: list[list[str]]) -> dict[str, Any]:
+        """Build a GraphQL payload with one aliased `Page` per ID batch."""
+        # Build variable definitions and values.
+        var_defs = ["$perPage: Int!"]
+        variables: dict[str, Any] = {"perPage": self._batch_size}
+        query_sections: list[str] = []
+
+        # For each batch of IDs, create an aliased Page block.
+        for idx, batch in enumerate(multi_batches):
+            alias = f"batch{idx + 1}"
+            ids_var = f"ids_{idx + 1}"
+
+            var_defs.append(f"${ids_var}: [Int!]!")
+            variables[ids_var] = [int(eid) for eid in batch]
+
+            query_sections.append(
+                f"""
+                {alias}: Page(page: 1, perPage: $perPage) {{
+                    media(id_in: ${ids_var}, type: ANIME) {{
+                        id
+                        episodes
+                        format
+                        seasonYear
+                        duration
+                    }}
                 }}
                 """
+            )
 
-                payload = {
-                    "query": query,
-                    "variables": variables,
-                }
-
-                # Single HTTP request with basic rate-limit handling.
-                while True:
-                    async with session.post(self.API_URL, json=payload) as response:
-                        if response.status == 429:
-                            retry = int(response.headers.get("Retry-After", "60"))
-                            log.warning(
-                                "AniList rate limit hit; sleeping %s seconds", retry
-                            )
-                            await asyncio.sleep(retry + 1)
-                            continue
-                        response.raise_for_status()
-                        raw: dict[str, Any] = await response.json()
-                    break
-
-                data = raw.get("data", {}) or {}
-
-                # For each alias/batch, map IDs back to entries and build SourceMeta.
-                for idx, batch in enumerate(multi_batches):
-                    alias = f"batch{idx + 1}"
-                    media_entries = data.get(alias, {}).get("media", []) or []
-
-                    by_id = {
-                        str(entry.get("id")): entry
-                        for entry in media_entries
-                        if isinstance(entry, dict) and entry.get("id") is not None
-                    }
+        query = f"""
+        query ({", ".join(var_defs)}) {{
+            {" ".join(query_sections)}
+        }}
+        """
 
-                    for entry_id in batch:
-                        entry = by_id.get(entry_id)
-
-                        if not entry:
-                            results.append((entry_id, None, True))
-                            continue
-
-                        episodes = entry.get("episodes")
-                        entry_format = entry.get("format")
-                        media_type = (
-                            SourceType.MOVIE
-                            if entry_format in ("MOVIE", "MUSIC")
-                            else SourceType.TV
-                            if entry_format
-                            in ("TV", "TV_SHORT", "OVA", "ONA", "SPECIAL")
-                            else None
+        return {
+            "query": query,
+            "variables": variables,
+        }
+
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        """POST a GraphQL payload, waiting out AniList rate limits."""
+        while True:
+            # Only hold a slot for the request itself so other requests can
+            # proceed while this one sleeps off a rate limit.
+            async with (
+                semaphore,
+                session.post(self.API_URL, json=payload) as response,
+            ):
+                if response.status != 429:
+                    if response.status == 400:
+                        # Cost rejections are returned so the caller can split
+                        try:
+                            raw = loads(await response.read())
+                        except ValueError:
+                            raw = None
+                        if isinstance(raw, dict) and _is_cost_error(raw):
+                            return raw
+                    response.raise_for_status()
+                    return loads(await response.read())
+                retry = int(response.headers.get("Retry-After", "60"))
+            log.warning("AniList rate limit hit; sleeping %s seconds", retry)
+            await asyncio.sleep(retry + 1)
+
+    async def _fetch_batches(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        multi_batches: list[list[str]],
+    ) -> list[tuple[str, dict[str | None, SourceMeta] | None, bool]]:
+        """Fetch a group of ID batches, splitting it if AniList finds it too costly.
+
+        Groups are split in half whenever AniList rejects them for exceeding its
+        query cost limit, and the smaller size is remembered for later requests.
+        """
+        results: list[tuple[str, dict[str | None, SourceMeta] | None, bool]] = []
+        # Stack of groups still to fetch, in reverse order
+        pending = [multi_batches]
+        while pending:
+            group = pending.pop()
+            limit = self._learned_pages_per_request
+            if len(group) > limit:
+                # Another request already learned a smaller safe size
+                pending.extend(
+                    group[start : start + limit]
+                    for start in reversed(range(0, len(group), limit))
+                )
+                continue
+
+            raw = await self._post(session, semaphore, self._build_payload(group))
+            if not _is_cost_error(raw):
+                results.extend(self._parse_batches(group, raw))
+                continue
+            if len(group) == 1:
+                raise RuntimeError(
+                    "AniList rejected a single-page query for exceeding its cost limit"
+                )
+            half = len(group) // 2
+            self._learned_pages_per_request = min(self._learned_pages_per_request, half)
+            log.info(
+                "AniList query cost limit hit; lowering pages per request to %d",
+                self._learned_pages_per_request,
+            )
+            pending.append(group[half:])
+            pending.append(group[:half])
+
+        return results
+
+    def _parse_batches(
+        self,
+        multi_batches: list[list[str]],
+        raw: dict[str, Any],
+    ) -> list[tuple[str, dict[str | None, SourceMeta] | None, bool]]:
+        """Map an aliased GraphQL response back to per-ID metadata results."""
+        data = raw.get("data", {}) or {}
+
+        results: list[tuple[str, dict[str | None, SourceMeta] | None, bool]] = []
+
+        # For each alias/batch, map IDs back to entries and build SourceMeta.
+        for idx, batch in enumerate(multi_batches):
+            alias = f"batch{idx + 1}"
+            media_entries = data.get(alias, {}).get("media", []) or []
+
+            by_id = {
+                str(entry.get("id")): entry
+                for entry in media_entries
+                if isinstance(entry, dict) and entry.get("id") is not None
+            }
+
+            for entry_id in batch:
+                entry = by_id.get(entry_id)
+
+                if not entry:
+                    results.append((entry_id, None, True))
+                    continue
+
+                episodes = entry.get("episodes")
+                entry_format = entry.get("format")
+                media_type = (
+                    SourceType.MOVIE
+                    if entry_format in ("MOVIE", "MUSIC")
+                    else SourceType.TV
+                    if entry_format in ("TV", "TV_SHORT", "OVA", "ONA", "SPECIAL")
+                    else None
+                )
+
+                if isinstance(episodes, int) and episodes > 0:
+                    scope_meta: dict[str | None, SourceMeta] | None = {
+                        None: SourceMeta(
+                            type=media_type,
+                            episodes=episodes,
+                            start_year=entry.get("seasonYear"),
+                            duration=entry.get("duration"),
                         )
+                    }
+                else:
+                    # No valid episode count → treat as null mapping
+                    scope_meta = None
 
-                        if isinstance(episodes, int) and episodes > 0:
-                            scope_meta: dict[str | None, SourceMeta] | None = {
-                                None: SourceMeta(
-                                    type=media_type,
-                                    episodes=episodes,
-                                    start_year=entry.get("seasonYear"),
-                                    duration=entry.get("duration"),
-                                )
-                            }
-                        else:
-                            # No valid episode count → treat as null mapping
-                            scope_meta = None
-
-                        results.append((entry_id, scope_meta, True))
+                results.append((entry_id, scope_meta, True))
 
         return results
+
+
+def _is_cost_error(raw: dict[str, Any]) -> bool:
+    """Return True if a GraphQL response reports an exceeded query cost."""
+    errors = raw.get("errors")
+    if not isinstance(errors, list):
+        return False
+    for error in errors:
+        message = error.get("message") if isinstance(error, dict) else None
+        if isinstance(message, str) and _COST_ERROR_PATTERN.search(message):
+            return True
+    return False
@@ -2,8 +2,10 @@
 
 import asyncio
 import json
+import os
 import subprocess
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
 from typing import Any
@@ -11,6 +13,7 @@ from typing import Any
 from anibridge_mappings.core.graph import IdMappingGraph
 from anibridge_mappings.core.meta import MetaStore, SourceType
 from anibridge_mappings.sources.base import IdMappingSource, MetadataSource
+from anibridge_mappings.utils.serialization import loads
 
 log = getLogger(__name__)
 
@@ -166,14 +169,15 @@ class AnimeAggregationsSource(IdMappingSource, MetadataSource):
         if not anime_dir.is_dir():
             raise RuntimeError("AnimeAggregations repo missing anime/ directory")
 
-        entries: list[dict[str, Any]] = []
-        for path in sorted(anime_dir.glob("*.json")):
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                log.warning("Skipping invalid JSON file %s", path.name)
-                continue
+        # Reading thousands of small files is I/O bound, so overlap the reads.
+        # `map` yields in input order, keeping entries sorted by path.
+        paths = sorted(anime_dir.glob("*.json"))
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            loaded = list(pool.map(cls._load_one, paths))
 
+        entries: list[dict[str, Any]] = []
+        for path, payload in loaded:
             if not isinstance(payload, dict):
                 continue
 
@@ -184,6 +188,16 @@ class AnimeAggregationsSource(IdMappingSource, MetadataSource):
 
         return entries
 
+    @staticmethod
+    def _load_one(path: Path) -> tuple[Path, Any]:
+        """Read and decode one entry file, returning None for invalid JSON."""
+        try:
+            payload = loads(path.read_bytes())
+        except json.JSONDecodeError:
+            log.warning("Skipping invalid JSON file %s", path.name)
+            return (path, None)
+        return (path, payload)
+
     @staticmethod
     def _normalize_numeric(value: Any) -> str | None:
         """Normalize numeric IDs into string values."""
@@ -78,6 +78,8 @@ class CachedMetadataSource(MetadataSource):
 
     CACHE_VERSION: ClassVar[int] = 1
     DATA_DIR: ClassVar[Path] = Path("data/meta")
+    DNS_CACHE_TTL: ClassVar[int] = 300
+    KEEPALIVE_TIMEOUT: ClassVar[int] = 75
 
     provider_key: ClassVar[str]
     cache_filename: ClassVar[str]
@@ -91,6 +93,7 @@ class CachedMetadataSource(MetadataSource):
         self._concurrency = max(1, concurrency)
         self._cache: dict[str, dict[str | None, SourceMeta] | None] = {}
         self._prepared = False
+        self._session: aiohttp.ClientSession | None = None
 
     async def prepare(self) -> None:
         """Load or initialize the metadata cache."""
@@ -173,18 +176,18 @@ class CachedMetadataSource(MetadataSource):
     ) -> list[tuple[str, dict[str | None, SourceMeta] | None, bool]]:
         """Fetch metadata for missing entry IDs."""
         semaphore = asyncio.Semaphore(self._concurrency)
-        async with aiohttp.ClientSession(**self._session_kwargs()) as session:
-            return await asyncio.gather(
-                *(
-                    self._fetch_with_semaphore(
-                        session,
-                        semaphore,
-                        entry_id,
-                        scope,
-                    )
-                    for entry_id, scope in entry_ids
+        session = await self._get_session()
+        return await asyncio.gather(
+            *(
+                self._fetch_with_semaphore(
+                    session,
+                    semaphore,
+                    entry_id,
+                    scope,
                 )
+                for entry_id, scope in entry_ids
             )
+        )
 
     async def _fetch_with_semaphore(
         self,
@@ -207,6 +210,25 @@ class CachedMetadataSource(MetadataSource):
         """Return keyword args for aiohttp session creation."""
         return {}
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._concurrency,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, **self._session_kwargs()
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session, if one was opened."""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
     def _load_cache(self) -> dict[str, dict[str | None, SourceMeta] | None]:
         """Load cached metadata from disk, if present."""
         path = self.cache_path
@@ -2,6 +2,7 @@
 
 import re
 from collections.abc import Mapping
+from functools import cache
 from typing import Any
 
 from anibridge_mappings.core.graph import EpisodeMappingGraph
@@ -13,6 +14,12 @@ SourceTargetMap = dict[
     dict[TargetNode, dict[str, set[str]]],
 ]
 
+_DESCRIPTOR_PATTERN = re.compile(
+    r"^(?P<provider>[a-zA-Z_][a-zA-Z0-9_]*):(?P<id>[^:]+)(?::(?P<scope>[^:]+))?$"
+)
+_SEASON_SCOPE_PATTERN = re.compile(r"^s([0-9]+)$")
+_ANIDB_SCOPE_ORDER = {"R": 0, "S": 1, "O": 2, "C": 3, "T": 4, "P": 5}
+
 
 def parse_descriptor(descriptor: str) -> tuple[str, str, str | None]:
     """Parse `provider:id[:scope]` strings back into tuple form.
@@ -23,14 +30,11 @@ def parse_descriptor(descriptor: str) -> tuple[str, str, str | None]:
     Returns:
         tuple[str, str, str | None]: Provider, entry ID, and optional scope.
     """
-    parts = descriptor.split(":", 2)
-    if len(parts) == 2:
-        provider, entry_id = parts
-        return provider, entry_id, None
-    if len(parts) == 3:
-        provider, entry_id, scope = parts
-        return provider, entry_id, scope
-    raise ValueError(f"Invalid descriptor: {descriptor}")
+    provider, sep, rest = descriptor.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid descriptor: {descriptor}")
+    entry_id, sep, scope = rest.partition(":")
+    return provider, entry_id, scope if sep else None
 
 
 def normalize_episode_key(value: str | None) -> str | None:
@@ -133,7 +137,7 @@ def build_source_target_map(graph: EpisodeMappingGraph) -> SourceTargetMap:
             continue
 
         for neighbor in sorted(
-            graph.neighbors(node),
+            graph.neighbors_view(node),
             key=lambda n: (n[0], n[1], "" if n[2] is None else n[2], n[3]),
         ):
             if neighbor == node:
@@ -518,15 +522,16 @@ def _merge_adjacent_numeric_keys(mapping: dict[str, str]) -> dict[str, str]:
     return out
 
 
+@cache
 def provider_scope_sort_key(k: str):
-    """Return a sort key for provider-scoped mapping descriptors."""
+    """Return a sort key for provider-scoped mapping descriptors.
+
+    Results are memoized since the same descriptors are sorted repeatedly.
+    """
     if k.startswith("$"):
         return (0, k, "")
 
-    match = re.match(
-        r"^(?P<provider>[a-zA-Z_][a-zA-Z0-9_]*):(?P<id>[^:]+)(?::(?P<scope>[^:]+))?$",
-        k,
-    )
+    match = _DESCRIPTOR_PATTERN.match(k)
     if not match:
         return (2, k, "")
 
@@ -538,11 +543,10 @@ def provider_scope_sort_key(k: str):
         scope_key = (0, "")
     else:
         scope_upper = scope.upper()
-        anidb_scope_order = {"R": 0, "S": 1, "O": 2, "C": 3, "T": 4, "P": 5}
-        if scope_upper in anidb_scope_order:
-            scope_key = (1, anidb_scope_order[scope_upper])
+        if scope_upper in _ANIDB_SCOPE_ORDER:
+            scope_key = (1, _ANIDB_SCOPE_ORDER[scope_upper])
         else:
-            scope_match = re.match(r"^s([0-9]+)$", scope)
+            scope_match = _SEASON_SCOPE_PATTERN.match(scope)
             scope_key = (2, int(scope_match.group(1))) if scope_match else (3, scope)
     return (1, provider, id_key, scope_key)
 
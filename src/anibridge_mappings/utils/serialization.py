@@ -0,0 +1,48 @@
+"""JSON encoding helpers that use `orjson` when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data (bytes | str): Encoded JSON document.
+
+    Returns:
+        Any: Decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON. `orjson` raises
+            its own subclass of this error.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: Any, *, pretty: bool = False) -> bytes:
+    """Encode a payload as UTF-8 JSON.
+
+    Args:
+        payload (Any): JSON-serializable payload.
+        pretty (bool): Whether to indent with two spaces and end with a newline.
+
+    Returns:
+        bytes: Encoded JSON document.
+    """
+    if orjson is not None:
+        if pretty:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n"
+        return orjson.dumps(payload)
+    if pretty:
+        rendered = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+    else:
+        rendered = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return rendered.encode("utf-8")